@@ -5,7 +5,8 @@ Reads settings from configs/crawl.policy.yaml and provides defaults.
 from __future__ import annotations
 
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional
 
@@ -23,6 +24,7 @@ class HttpConfig:
     user_agent: str = "Mozilla/5.0 (compatible; SpaceCrawler/1.0)"
     follow_redirects: bool = True
     max_redirects: int = 5
+    http2: bool = False  # Scrapy: HTTP/2-only HTTPS handler (needs h2)
 
 
 @dataclass
@@ -69,6 +71,13 @@ class UserAgentRotationConfig:
     identify: bool = True
 
 
+@dataclass
+class ExtractionConfig:
+    """Extraction execution settings."""
+    process_pool: bool = False  # Run extraction in worker processes (pays off when extraction > ~5ms/page)
+    max_workers: Optional[int] = None  # None = os.cpu_count()
+
+
 @dataclass
 class CrawlerConfig:
     """Complete crawler configuration."""
@@ -77,6 +86,7 @@ class CrawlerConfig:
     protocol: ProtocolConfig
     robots: RobotsConfig
     user_agent_rotation: UserAgentRotationConfig
+    extraction: ExtractionConfig = field(default_factory=ExtractionConfig)
     
     @staticmethod
     def _deep_merge_dicts(base: dict, override: dict) -> dict:
@@ -141,6 +151,7 @@ class CrawlerConfig:
             protocol_data = data.get("protocol", {})
             robots_data = data.get("robots", {})
             ua_rotation_data = data.get("user_agent_rotation", {})
+            extraction_data = data.get("extraction", {})
             
             return cls(
                 http=HttpConfig(
@@ -149,6 +160,7 @@ class CrawlerConfig:
                     user_agent=http_data.get("user_agent", "Mozilla/5.0 (compatible; SpaceCrawler/1.0)"),
                     follow_redirects=http_data.get("follow_redirects", True),
                     max_redirects=http_data.get("max_redirects", 5),
+                    http2=http_data.get("http2", False),
                 ),
                 retry=RetryConfig(
                     max_attempts=retry_data.get("max_attempts", 3),
@@ -172,6 +184,10 @@ class CrawlerConfig:
                     enabled=ua_rotation_data.get("enabled", True),
                     identify=ua_rotation_data.get("identify", True),
                 ),
+                extraction=ExtractionConfig(
+                    process_pool=extraction_data.get("process_pool", False),
+                    max_workers=extraction_data.get("max_workers"),
+                ),
             )
         except Exception:
             # If anything goes wrong, return defaults
@@ -186,14 +202,19 @@ class CrawlerConfig:
             protocol=ProtocolConfig(),
             robots=RobotsConfig(),
             user_agent_rotation=UserAgentRotationConfig(),
+            extraction=ExtractionConfig(),
         )
 
 
 # Convenience function for quick access
+@lru_cache(maxsize=4)
 def load_crawler_config(config_path: Optional[Path] = None, profile: Optional[str] = None) -> CrawlerConfig:
     """
     Load crawler configuration from YAML or return defaults.
     
+    Results are cached per (config_path, profile), so settings and middlewares
+    share one parse. Treat the returned config as read-only.
+    
     Args:
         config_path: Path to base config file (defaults to configs/crawl.policy.yaml)
         profile: Profile name to load from configs/profiles/{profile}.yaml
@@ -24,11 +24,12 @@ def normalize_phone(raw: str | None, default_country: str = "US") -> str | None:
 	s = str(raw).strip()
 	if not s:
 		return None
-	# Remove extensions before processing
-	s = re.sub(_EXTENSION, '', s).strip()
+	# Remove extensions before processing (every marker contains an 'x')
+	if "x" in s or "X" in s:
+		s = _EXTENSION.sub('', s).strip()
 	# Preserve leading '+' if present to detect intentional country code
 	has_plus = s.startswith("+")
-	digits = re.sub(_DIGITS, "", s)
+	digits = _DIGITS.sub("", s)
 	if not digits:
 		return None
 
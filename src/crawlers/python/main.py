@@ -14,21 +14,34 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import concurrent.futures
 import csv
+import functools
+import importlib.util
 import json
 import random
+import socket
 import sys
 import time
+from collections import OrderedDict
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
+# httpx is the heaviest import here; it is loaded on first fetch by _ensure_httpx()
+# so `--help` and test imports stay fast
+httpx = None  # type: ignore
+
+# orjson serializes straight to UTF-8 bytes; stdlib json is the fallback
 try:
-	import httpx
+    import orjson
 except ImportError:  # pragma: no cover
-	httpx = None  # type: ignore
+    orjson = None  # type: ignore
+
+# HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to HTTP/1.1 without it
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 try:
     from src.crawlers.python.extract import extract_all
@@ -62,6 +75,7 @@ try:
     ) if _config.user_agent_rotation.enabled else None
 except ImportError:
     # Fallback if config module not available
+    _config = None
     _DEFAULT_CONCURRENCY = 50  # configDefaultOverride.concurrency
     _DEFAULT_TIMEOUT = 12.0  # configDefaultOverride.timeout
     _DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; SpaceCrawler/1.0)"
@@ -72,7 +86,30 @@ except ImportError:
     # Fallback for calculate_backoff if config not available
     def calculate_backoff(attempt: int, config=None) -> float:
         """Fallback backoff calculation."""
-        return (2 ** attempt) * 0.5 + random.uniform(0, 0.5)# ---------- CLI ----------
+        return (2 ** attempt) * 0.5 + random.uniform(0, 0.5)
+
+# Protocol order is fixed for the run: resolve it once instead of per domain
+_PROTOCOLS: Tuple[str, ...] = tuple(
+    proto for proto, enabled in (
+        ("https", _config.protocol.try_https_first if _config else True),
+        ("http", _config.protocol.fallback_to_http if _config else False),
+    ) if enabled
+) or ("https",)  # Fallback if both disabled
+
+# Rotated User-Agents are pre-formatted once; fetches just pick one
+_UA_POOL: Tuple[str, ...] = tuple(_UA_ROTATOR.get_all()) if _UA_ROTATOR else ()
+
+# Worker processes for extract_all (created in run() when extraction.process_pool is on)
+_EXTRACT_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+# Response bodies beyond this are truncated (bounds memory per in-flight request)
+_MAX_BODY_BYTES = 2 * 1024 * 1024
+
+# Addresses from the DNS pre-check, reused by every connection to that host (LRU-bounded)
+_DNS_CACHE: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
+_DNS_CACHE_SIZE = 4096
+
+# ---------- CLI ----------
 
 
 def build_default_paths() -> tuple[Path, Path]:
@@ -164,6 +201,27 @@ def _domain_from_value(value: str) -> Optional[str]:
     return v.lower().lstrip("www.")
 
 
+def _domains_from_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Yield domains from headerless lines (first column, split on , ; or tab).
+    
+    Iterates lazily so large inputs are never held in memory as one string.
+    """
+    for line in lines:
+        line = line.rstrip("\r\n")
+        if not line.strip():
+            continue
+        first = line
+        if "," in line:
+            first = line.split(",", 1)[0]
+        elif ";" in line:
+            first = line.split(";", 1)[0]
+        elif "\t" in line:
+            first = line.split("\t", 1)[0]
+        d = _domain_from_value(first)
+        if d:
+            yield d
+
+
 def load_domains(csv_path: Path) -> List[str]:
     if not csv_path.exists():
         raise FileNotFoundError(f"Input CSV not found: {csv_path}")
@@ -206,22 +264,8 @@ def load_domains(csv_path: Path) -> List[str]:
             if not has_known_header:
                 # Treat as headerless: read each line, split only on common delimiters (not '.')
                 f.seek(0)
-                text = f.read()
-                for line in text.splitlines():
-                    if not line.strip():
-                        continue
-                    first = line
-                    if "," in line:
-                        first = line.split(",", 1)[0]
-                    elif ";" in line:
-                        first = line.split(";", 1)[0]
-                    elif "\t" in line:
-                        first = line.split("\t", 1)[0]
-                    d = _domain_from_value(first)
-                    if d:
-                        domains.append(d)
                 # return early since we've handled full file
-                return _dedupe_preserve_order(domains)
+                return _dedupe_preserve_order(_domains_from_lines(f))
 
             for row in reader:
                 # Row-level fallback across candidate fields
@@ -244,38 +288,27 @@ def load_domains(csv_path: Path) -> List[str]:
         else:
             # No header: treat as simple CSV with a single column or first delimited column
             f.seek(0)
-            text = f.read()
-            for line in text.splitlines():
-                if not line.strip():
-                    continue
-                first = line
-                if "," in line:
-                    first = line.split(",", 1)[0]
-                elif ";" in line:
-                    first = line.split(";", 1)[0]
-                elif "\t" in line:
-                    first = line.split("\t", 1)[0]
-                d = _domain_from_value(first)
-                if d:
-                    domains.append(d)
+            domains.extend(_domains_from_lines(f))
 
     return _dedupe_preserve_order(domains)
 
 
-def _dedupe_preserve_order(items: List[str]) -> List[str]:
-    seen = set()
-    out: List[str] = []
-    for it in items:
-        if it not in seen:
-            seen.add(it)
-            out.append(it)
-    return out
+def _dedupe_preserve_order(items: Iterable[str]) -> List[str]:
+    # dicts keep insertion order, so this dedupes in a single C-level pass
+    return list(dict.fromkeys(items))
 
 
 def ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
 
+def _ndjson_chunk(records: Iterable[dict]) -> bytes:
+    """Serialize records into one UTF-8 NDJSON payload (single write per batch)."""
+    if orjson is not None:
+        return b"".join(orjson.dumps(r) + b"\n" for r in records)
+    return "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records).encode("utf-8")
+
+
 # ---------- Placeholder crawl/extract ----------
 
 @dataclass
@@ -305,6 +338,7 @@ def _now_iso() -> str:
     )
 
 
+@functools.lru_cache(maxsize=None)
 def _derive_company_name(domain: str) -> Optional[str]:
     """Derive a basic company name from domain (fallback only)."""
     try:
@@ -316,23 +350,162 @@ def _derive_company_name(domain: str) -> Optional[str]:
         return None
 
 
+def _ensure_httpx() -> Any:
+    """Import httpx on first use; returns None if it isn't installed."""
+    global httpx
+    if httpx is None:
+        try:
+            import httpx as _httpx
+        except ImportError:  # pragma: no cover
+            return None
+        httpx = _httpx
+    return httpx
+
+
+@functools.lru_cache(maxsize=None)
+def _request_headers(user_agent: str) -> Any:
+    """
+    Build the request headers for a User-Agent once and reuse them.
+    
+    There are only a handful of UA variants, so every domain after the first
+    per variant skips header construction and normalization.
+    """
+    return httpx.Headers({
+        "User-Agent": user_agent,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+    })
+
+
+def _elapsed_ms(start_ns: int) -> int:
+    """Milliseconds since a time.monotonic_ns() reading (immune to wall-clock jumps)."""
+    return (time.monotonic_ns() - start_ns) // 1_000_000
+
+
+def _cached_addresses(host: str) -> Optional[Tuple[str, ...]]:
+    addresses = _DNS_CACHE.get(host)
+    if addresses is not None:
+        _DNS_CACHE.move_to_end(host)
+    return addresses
+
+
+def _cache_addresses(host: str, addresses: Tuple[str, ...]) -> None:
+    _DNS_CACHE[host] = addresses
+    _DNS_CACHE.move_to_end(host)
+    if len(_DNS_CACHE) > _DNS_CACHE_SIZE:
+        _DNS_CACHE.popitem(last=False)
+
+
+async def _dns_resolves(domain: str, timeout: float = 3.0) -> bool:
+    """
+    Resolve the domain once before any HTTP work.
+
+    Resolved addresses go into _DNS_CACHE so the HTTP connections (fast path,
+    retries and the HTTP fallback) skip a second lookup.
+
+    Returns False only on a definite resolver failure (gaierror); timeouts and
+    other socket errors return True so the regular fetch path decides.
+    """
+    if _cached_addresses(domain):
+        return True
+    loop = asyncio.get_running_loop()
+    try:
+        infos = await asyncio.wait_for(
+            loop.getaddrinfo(domain, 443, type=socket.SOCK_STREAM), timeout=timeout
+        )
+    except socket.gaierror:
+        return False
+    except (asyncio.TimeoutError, OSError):
+        return True
+    addresses = tuple(dict.fromkeys(info[4][0] for info in infos))
+    if addresses:
+        _cache_addresses(domain, addresses)
+    return True
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_dns_backend() -> Any:
+    """
+    httpcore network backend that connects to the pre-resolved addresses.
+
+    Only the TCP connect target changes: TLS still uses the hostname for SNI
+    and certificate checks. Hosts missing from the cache (e.g. redirect
+    targets) resolve normally.
+    """
+    import httpcore
+
+    class _CachedDNSBackend(httpcore.AsyncNetworkBackend):
+        def __init__(self) -> None:
+            self._backend = httpcore.AnyIOBackend()
+
+        async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+            addresses = _cached_addresses(host) or (host,)
+            for address in addresses[:-1]:
+                try:
+                    return await self._backend.connect_tcp(
+                        address, port, timeout=timeout, local_address=local_address,
+                        socket_options=socket_options,
+                    )
+                except httpcore.ConnectError:
+                    continue
+            return await self._backend.connect_tcp(
+                addresses[-1], port, timeout=timeout, local_address=local_address,
+                socket_options=socket_options,
+            )
+
+        async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+            return await self._backend.connect_unix_socket(
+                path, timeout=timeout, socket_options=socket_options
+            )
+
+        async def sleep(self, seconds: float) -> None:
+            await self._backend.sleep(seconds)
+
+    return _CachedDNSBackend()
+
+
+def _build_transport(limits: Any) -> Any:
+    """HTTP transport whose connections reuse the addresses from _dns_resolves."""
+    transport = httpx.AsyncHTTPTransport(http2=_HTTP2_AVAILABLE, limits=limits)
+    # httpx has no public hook for the httpcore network backend; the pool
+    # hands this attribute to every connection it opens
+    transport._pool._network_backend = _cached_dns_backend()
+    return transport
+
+
 async def _fetch_with_protocol(
     domain: str, protocol: str, timeout: float, user_agent: str, client: Any
-) -> Tuple[Any, int]:
+) -> Tuple[Any, bytes, int]:
     """
     Fetch HTML using specific protocol (https or http).
     
+    The body is streamed and capped at _MAX_BODY_BYTES so giant pages
+    don't stall the batch or blow up memory.
+    
     Returns:
-        Tuple of (response, response_time_ms)
+        Tuple of (response, body_bytes, response_time_ms)
     
     Raises:
         httpx exceptions on failure
     """
     url = f"{protocol}://{domain}"
-    start_time = time.time()
-    response = await client.get(url)
-    response_time_ms = int((time.time() - start_time) * 1000)
-    return response, response_time_ms
+    start_ns = time.monotonic_ns()
+    body = bytearray()
+    async with client.stream("GET", url) as response:
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) >= _MAX_BODY_BYTES:
+                del body[_MAX_BODY_BYTES:]
+                break
+    return response, bytes(body), _elapsed_ms(start_ns)
+
+
+def _decode_body(body: bytes, charset: Optional[str]) -> str:
+    """Decode once using the declared charset (utf-8 if missing or unknown)."""
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
 
 
 async def fetch_and_extract(domain: str, timeout: float, user_agent: str) -> CrawlResult:
@@ -356,8 +529,11 @@ async def fetch_and_extract(domain: str, timeout: float, user_agent: str) -> Cra
     Returns:
         CrawlResult with extracted data or error information
     """
+    # One timestamp per domain: every result built below shares it
+    now = _now_iso()
+
     # Use rotated user-agent if enabled, otherwise use provided/default
-    effective_user_agent = _UA_ROTATOR.get_random() if _UA_ROTATOR else user_agent
+    effective_user_agent = random.choice(_UA_POOL) if _UA_POOL else user_agent
     
     # Check robots.txt compliance if enabled
     if _ROBOTS_CACHE is not None:
@@ -377,7 +553,7 @@ async def fetch_and_extract(domain: str, timeout: float, user_agent: str) -> Cra
                     twitter_url=None,
                     instagram_url=None,
                     address=None,
-                    crawled_at=_now_iso(),
+                    crawled_at=now,
                     http_status=0,
                     response_time_ms=0,
                     page_size_bytes=0,
@@ -395,7 +571,7 @@ async def fetch_and_extract(domain: str, timeout: float, user_agent: str) -> Cra
             # (Don't block legitimate crawls due to robots.txt fetch errors)
             pass
     
-    if httpx is None:
+    if _ensure_httpx() is None:
         # Fallback if httpx not installed (shouldn't happen in normal usage)
         return CrawlResult(
             domain=domain,
@@ -407,7 +583,7 @@ async def fetch_and_extract(domain: str, timeout: float, user_agent: str) -> Cra
             twitter_url=None,
             instagram_url=None,
             address=None,
-            crawled_at=_now_iso(),
+            crawled_at=now,
             http_status=0,
             response_time_ms=0,
             page_size_bytes=0,
@@ -415,175 +591,226 @@ async def fetch_and_extract(domain: str, timeout: float, user_agent: str) -> Cra
             error="httpx not installed",
         )
     
-    # Use config values for retry and protocol strategy
-    max_retries = _config.retry.max_attempts if _config else 3
-    
-    # Build protocol list based on config
-    protocols = []
-    if _config:
-        if _config.protocol.try_https_first:
-            protocols.append("https")
-        if _config.protocol.fallback_to_http:
-            protocols.append("http")
-    if not protocols:  # Fallback if config missing or both disabled
-        protocols = ["https"]
+    # Dead domains are common in website lists: fail fast before building a client
+    if not await _dns_resolves(domain):
+        return CrawlResult(
+            domain=domain,
+            url=f"https://{domain}",
+            phones=[],
+            company_name=_derive_company_name(domain),
+            facebook_url=None,
+            linkedin_url=None,
+            twitter_url=None,
+            instagram_url=None,
+            address=None,
+            crawled_at=now,
+            http_status=0,
+            response_time_ms=0,
+            page_size_bytes=0,
+            method="http",
+            error="DNS error: domain not found",
+        )
     
-    start_time = time.time()
-    last_error = None
-    redirect_chain: Optional[List[str]] = None
+    start_ns = time.monotonic_ns()
     
+    # Keep connections alive so retries and the HTTP fallback reuse the socket
+    limits = httpx.Limits(keepalive_expiry=30.0)
     async with httpx.AsyncClient(
         timeout=timeout,
         follow_redirects=True,
-        headers={
-            "User-Agent": effective_user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        },
+        http2=_HTTP2_AVAILABLE,
+        limits=limits,
+        headers=_request_headers(effective_user_agent),
+        transport=_build_transport(limits),
     ) as client:
-        for protocol in protocols:
-            url = f"{protocol}://{domain}"
-            
-            for attempt in range(max_retries):
+        first_error: Optional[Exception] = None
+        
+        # Fast path: most domains answer the very first HTTPS request, so skip
+        # all retry/fallback bookkeeping unless that request fails
+        if _PROTOCOLS[0] == "https":
+            try:
+                response, body, response_time_ms = await _fetch_with_protocol(
+                    domain, "https", timeout, effective_user_agent, client
+                )
+                return await _build_success_result(domain, response, body, response_time_ms, now)
+            except Exception as e:
+                first_error = e
+        
+        return await _retry_fetch_slow(
+            domain, timeout, effective_user_agent, client, now, start_ns, first_error
+        )
+
+
+async def _extract_page(html: str, final_url: str) -> dict:
+    """Run extract_all inline, or in the process pool when enabled."""
+    if _EXTRACT_POOL is None:
+        return extract_all(html, final_url)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXTRACT_POOL, extract_all, html, final_url)
+
+
+async def _build_success_result(
+    domain: str, response: Any, body: bytes, response_time_ms: int, crawled_at: str
+) -> CrawlResult:
+    """Extract company data from a fetched page and build the result."""
+    # Track redirect chain if any
+    redirect_chain: Optional[List[str]] = None
+    if hasattr(response, 'history') and response.history:
+        redirect_chain = [str(r.url) for r in response.history]
+        redirect_chain.append(str(response.url))
+    
+    html = _decode_body(body, response.charset_encoding)
+    final_url = str(response.url)
+    
+    # Extract company data
+    extracted = await _extract_page(html, final_url)
+    
+    # Use extracted company name or derive from domain as fallback
+    company_name = extracted.get('company_name') or _derive_company_name(domain)
+    
+    return CrawlResult(
+        domain=domain,
+        url=final_url,
+        phones=extracted['phones'],
+        company_name=company_name,
+        facebook_url=extracted['facebook_url'],
+        linkedin_url=extracted['linkedin_url'],
+        twitter_url=extracted['twitter_url'],
+        instagram_url=extracted['instagram_url'],
+        address=extracted['address'],
+        crawled_at=crawled_at,
+        http_status=response.status_code,
+        response_time_ms=response_time_ms,
+        page_size_bytes=len(body),
+        method='http',
+        error=None,
+        _redirect_chain=redirect_chain if redirect_chain and len(redirect_chain) > 1 else None,
+    )
+
+
+def _classify_fetch_error(e: Exception, timeout: float) -> Tuple[str, str]:
+    """
+    Map a fetch exception to (error message, action).
+    
+    Actions:
+        "retry"    - transient, retry the same protocol with backoff
+        "fallback" - give up on this protocol and try the next one (SSL)
+        "fail"     - terminal for the domain (DNS)
+    """
+    if isinstance(e, httpx.TimeoutException):
+        return f"Timeout after {timeout}s", "retry"
+    
+    if isinstance(e, httpx.ConnectError):
+        # DNS, connection refused, SSL, etc.
+        # Check __cause__ for underlying OS error details
+        error_msg = str(e).lower()
+        cause = getattr(e, '__cause__', None)
+        cause_str = str(cause).lower() if cause else ''
+        
+        # DNS errors: various patterns across platforms
+        # (mostly pre-empted by _dns_resolves; kept for resolver races)
+        if any(pattern in error_msg or pattern in cause_str for pattern in [
+            'name or service not known',  # Linux
+            'nodename nor servname',      # BSD/macOS
+            'getaddrinfo failed',         # Windows
+            'no address associated',      # Various
+            '[errno -2]',                 # getaddrinfo error code
+            '[errno -3]',                 # temporary failure
+            'name resolution',
+        ]):
+            return "DNS error: domain not found", "fail"
+        
+        # SSL/certificate errors: try HTTP fallback
+        if any(pattern in error_msg or pattern in cause_str for pattern in [
+            'ssl',
+            'certificate',
+            'handshake',
+            'tls',
+        ]):
+            return "SSL error", "fallback"
+        
+        # Connection refused: might be transient, retry
+        if 'connection refused' in error_msg or 'connection refused' in cause_str or '[errno 111]' in cause_str:
+            return "Connection refused", "retry"
+        
+        # Connection reset: retry
+        if 'connection reset' in error_msg or 'connection reset' in cause_str or '[errno 104]' in cause_str:
+            return "Connection reset", "retry"
+        
+        # Generic connection error: retry
+        return f"Connection error: {type(e).__name__}", "retry"
+    
+    if isinstance(e, httpx.HTTPError):
+        # Generic HTTP error: retry with backoff
+        return f"HTTP error: {type(e).__name__}: {str(e)}"[:100], "retry"
+    
+    # Unknown error: retry with backoff
+    return f"Error: {type(e).__name__}: {str(e)}"[:100], "retry"
+
+
+async def _retry_fetch_slow(
+    domain: str,
+    timeout: float,
+    user_agent: str,
+    client: Any,
+    crawled_at: str,
+    start_ns: int,
+    first_error: Optional[Exception] = None,
+) -> CrawlResult:
+    """
+    Retry/fallback path once the fast first HTTPS attempt has failed.
+    
+    `first_error` is the exception from the fast path; it counts as the
+    first HTTPS attempt so the total attempt budget is unchanged.
+    """
+    # Use config values for retry strategy
+    max_retries = _config.retry.max_attempts if _config else 3
+    retry_config = _config.retry if _config else None
+    last_error = None
+    
+    for protocol in _PROTOCOLS:
+        url = f"{protocol}://{domain}"
+        
+        for attempt in range(max_retries):
+            if first_error is not None and protocol == "https" and attempt == 0:
+                exc, first_error = first_error, None
+            else:
                 try:
-                    response, response_time_ms = await _fetch_with_protocol(
-                        domain, protocol, timeout, effective_user_agent, client
+                    response, body, response_time_ms = await _fetch_with_protocol(
+                        domain, protocol, timeout, user_agent, client
                     )
-                    
-                    # Track redirect chain if any
-                    if hasattr(response, 'history') and response.history:
-                        redirect_chain = [str(r.url) for r in response.history]
-                        redirect_chain.append(str(response.url))
-                    
-                    html = response.text
-                    status = response.status_code
-                    page_size = len(html.encode('utf-8'))
-                    final_url = str(response.url)
-                    
-                    # Extract company data
-                    extracted = extract_all(html, final_url)
-                    
-                    # Use extracted company name or derive from domain as fallback
-                    company_name = extracted.get('company_name') or _derive_company_name(domain)
-                    
-                    return CrawlResult(
-                        domain=domain,
-                        url=final_url,
-                        phones=extracted['phones'],
-                        company_name=company_name,
-                        facebook_url=extracted['facebook_url'],
-                        linkedin_url=extracted['linkedin_url'],
-                        twitter_url=extracted['twitter_url'],
-                        instagram_url=extracted['instagram_url'],
-                        address=extracted['address'],
-                        crawled_at=_now_iso(),
-                        http_status=status,
-                        response_time_ms=response_time_ms,
-                        page_size_bytes=page_size,
-                        method='http',
-                        error=None,
-                        _redirect_chain=redirect_chain if redirect_chain and len(redirect_chain) > 1 else None,
-                    )
-                
-                except httpx.TimeoutException as e:
-                    last_error = f"Timeout after {timeout}s"
-                    # Timeout: retry with backoff
-                    if attempt < max_retries - 1:
-                        backoff = calculate_backoff(attempt, _config.retry if _config else None)
-                        await asyncio.sleep(backoff)
-                        continue
-                
-                except httpx.ConnectError as e:
-                    # DNS, connection refused, SSL, etc.
-                    # Check __cause__ for underlying OS error details
-                    error_msg = str(e).lower()
-                    cause = getattr(e, '__cause__', None)
-                    cause_str = str(cause).lower() if cause else ''
-                    
-                    # DNS errors: various patterns across platforms
-                    if any(pattern in error_msg or pattern in cause_str for pattern in [
-                        'name or service not known',  # Linux
-                        'nodename nor servname',      # BSD/macOS
-                        'getaddrinfo failed',         # Windows
-                        'no address associated',      # Various
-                        '[errno -2]',                 # getaddrinfo error code
-                        '[errno -3]',                 # temporary failure
-                        'name resolution',
-                    ]):
-                        last_error = "DNS error: domain not found"
-                        # DNS error: terminal, no point retrying
-                        return CrawlResult(
-                            domain=domain,
-                            url=url,
-                            phones=[],
-                            company_name=_derive_company_name(domain),
-                            facebook_url=None,
-                            linkedin_url=None,
-                            twitter_url=None,
-                            instagram_url=None,
-                            address=None,
-                            crawled_at=_now_iso(),
-                            http_status=0,
-                            response_time_ms=int((time.time() - start_time) * 1000),
-                            page_size_bytes=0,
-                            method='http',
-                            error=last_error,
-                        )
-                    
-                    # SSL/certificate errors
-                    elif any(pattern in error_msg or pattern in cause_str for pattern in [
-                        'ssl',
-                        'certificate',
-                        'handshake',
-                        'tls',
-                    ]):
-                        last_error = "SSL error"
-                        # SSL error: try HTTP fallback
-                        break
-                    
-                    # Connection refused
-                    elif 'connection refused' in error_msg or 'connection refused' in cause_str or '[errno 111]' in cause_str:
-                        last_error = "Connection refused"
-                        # Connection refused: might be transient, retry
-                        if attempt < max_retries - 1:
-                            backoff = calculate_backoff(attempt, _config.retry if _config else None)
-                            await asyncio.sleep(backoff)
-                            continue
-                    
-                    # Connection reset
-                    elif 'connection reset' in error_msg or 'connection reset' in cause_str or '[errno 104]' in cause_str:
-                        last_error = "Connection reset"
-                        # Connection reset: retry
-                        if attempt < max_retries - 1:
-                            backoff = calculate_backoff(attempt, _config.retry if _config else None)
-                            await asyncio.sleep(backoff)
-                            continue
-                    
-                    # Generic connection error
-                    else:
-                        last_error = f"Connection error: {type(e).__name__}"
-                        # Generic error: retry
-                        if attempt < max_retries - 1:
-                            backoff = calculate_backoff(attempt, _config.retry if _config else None)
-                            await asyncio.sleep(backoff)
-                            continue
-                
-                except httpx.HTTPError as e:
-                    last_error = f"HTTP error: {type(e).__name__}: {str(e)}"[:100]
-                    # Generic HTTP error: retry with backoff
-                    if attempt < max_retries - 1:
-                        backoff = calculate_backoff(attempt, _config.retry if _config else None)
-                        await asyncio.sleep(backoff)
-                        continue
-                
+                    return await _build_success_result(domain, response, body, response_time_ms, crawled_at)
                 except Exception as e:
-                    last_error = f"Error: {type(e).__name__}: {str(e)}"[:100]
-                    # Unknown error: retry with backoff
-                    if attempt < max_retries - 1:
-                        backoff = calculate_backoff(attempt, _config.retry if _config else None)
-                        await asyncio.sleep(backoff)
-                        continue
-        
+                    exc = e
+            
+            last_error, action = _classify_fetch_error(exc, timeout)
+            
+            if action == "fail":
+                # DNS error: terminal, no point retrying
+                return CrawlResult(
+                    domain=domain,
+                    url=url,
+                    phones=[],
+                    company_name=_derive_company_name(domain),
+                    facebook_url=None,
+                    linkedin_url=None,
+                    twitter_url=None,
+                    instagram_url=None,
+                    address=None,
+                    crawled_at=crawled_at,
+                    http_status=0,
+                    response_time_ms=_elapsed_ms(start_ns),
+                    page_size_bytes=0,
+                    method='http',
+                    error=last_error,
+                )
+            
+            if action == "fallback":
+                break
+            
+            if attempt < max_retries - 1:
+                await asyncio.sleep(calculate_backoff(attempt, retry_config))
+    
     # All retries exhausted
     return CrawlResult(
         domain=domain,
@@ -595,9 +822,9 @@ async def fetch_and_extract(domain: str, timeout: float, user_agent: str) -> Cra
         twitter_url=None,
         instagram_url=None,
         address=None,
-        crawled_at=_now_iso(),
+        crawled_at=crawled_at,
         http_status=0,
-        response_time_ms=int((time.time() - start_time) * 1000),
+        response_time_ms=_elapsed_ms(start_ns),
         page_size_bytes=0,
         method='http',
         error=last_error or "Unknown error",
@@ -620,6 +847,7 @@ async def process_batch(
     # Gather with return_exceptions to avoid failing the whole run
     results: List[CrawlResult] = []
     gathered = await asyncio.gather(*tasks, return_exceptions=True)
+    now = _now_iso()
     for d, g in zip(batch_domains, gathered):
         if isinstance(g, Exception):
             results.append(
@@ -633,7 +861,7 @@ async def process_batch(
                     twitter_url=None,
                     instagram_url=None,
                     address=None,
-                    crawled_at=_now_iso(),
+                    crawled_at=now,
                     http_status=0,
                     response_time_ms=0,
                     page_size_bytes=0,
@@ -684,30 +912,42 @@ async def run(args: argparse.Namespace) -> int:
     info(f"  Domains: {total}")
     info(f"  Concurrency: {args.concurrency}")
     info(f"  Timeout: {args.timeout:.1f}s")
-    info(f"  User-Agent: {args.user_agent if not _UA_ROTATION_ENABLED else 'rotating (7 variants)'}")
+    info(f"  User-Agent: {args.user_agent if not _UA_ROTATION_ENABLED else f'rotating ({len(_UA_POOL)} variants)'}")
     info(f"  Robots.txt: {'enabled' if _ROBOTS_CACHE else 'disabled'}")
     info(f"  Output: {args.output}")
 
     ensure_parent_dir(args.output)
 
-    started = time.perf_counter()
+    started_ns = time.monotonic_ns()
 
     total_batches = max(1, (total + args.concurrency - 1) // args.concurrency)
     written = 0
 
-    # Open output file once, append NDJSON per result
-    with args.output.open("w", encoding="utf-8") as out_f:
-        for i, batch in enumerate(chunked(domains, args.concurrency), start=1):
-            log_batch_header(i, total_batches, len(batch))
-            for d in batch:
-                maybe_log_browser_fallback(d)
-
-            batch_results = await process_batch(batch, timeout=args.timeout, user_agent=args.user_agent)
-            for r in batch_results:
-                out_f.write(json.dumps(asdict(r), ensure_ascii=False) + "\n")
-                written += 1
+    # Offload CPU-bound extraction to worker processes if configured
+    global _EXTRACT_POOL
+    if _config and _config.extraction.process_pool:
+        _EXTRACT_POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=_config.extraction.max_workers
+        )
 
-    elapsed = time.perf_counter() - started
+    try:
+        # Open output file once, append one NDJSON chunk per batch
+        with args.output.open("wb") as out_f:
+            for i, batch in enumerate(chunked(domains, args.concurrency), start=1):
+                log_batch_header(i, total_batches, len(batch))
+                for d in batch:
+                    maybe_log_browser_fallback(d)
+
+                batch_results = await process_batch(batch, timeout=args.timeout, user_agent=args.user_agent)
+                out_f.write(_ndjson_chunk(asdict(r) for r in batch_results))
+                out_f.flush()
+                written += len(batch_results)
+    finally:
+        if _EXTRACT_POOL is not None:
+            _EXTRACT_POOL.shutdown()
+            _EXTRACT_POOL = None
+
+    elapsed = (time.monotonic_ns() - started_ns) / 1e9
     avg = (written / elapsed) if elapsed > 0 else 0.0
 
     print()
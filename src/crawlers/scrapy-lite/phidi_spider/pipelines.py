@@ -1,7 +1,27 @@
 """Custom Scrapy pipelines for Phidi crawler."""
 import json
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
 
+# orjson encodes straight to UTF-8 bytes; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# Large write buffer: many small NDJSON lines become few big write() calls
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _dumps_line(record) -> bytes:
+    """Serialize one record (dict or dataclass) as a UTF-8 NDJSON line."""
+    if orjson is not None:
+        # orjson serializes dataclass instances natively, slots included
+        return orjson.dumps(record) + b'\n'
+    if is_dataclass(record):
+        record = asdict(record)
+    return (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+
 
 class JsonLinesExportPipeline:
     """
@@ -21,7 +41,7 @@ class JsonLinesExportPipeline:
         if self.output_path:
             output_file = Path(self.output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
-            self.file = output_file.open('w', encoding='utf-8')
+            self.file = output_file.open('wb', buffering=_WRITE_BUFFER_SIZE)
     
     def close_spider(self, spider):
         """Close output file when spider finishes."""
@@ -31,6 +51,6 @@ class JsonLinesExportPipeline:
     def process_item(self, item, spider):
         """Write each item as a JSON line."""
         if self.file:
-            line = json.dumps(dict(item), ensure_ascii=False) + '\n'
-            self.file.write(line)
+            record = item if isinstance(item, dict) or is_dataclass(item) else dict(item)
+            self.file.write(_dumps_line(record))
         return item
@@ -0,0 +1,69 @@
+"""Custom DNS resolvers for Phidi crawler."""
+import time
+
+from scrapy.resolver import CachingThreadedResolver, dnscache
+from scrapy.utils.datatypes import LocalCache
+from twisted.internet import defer
+from twisted.internet.base import ThreadedResolver
+
+# getaddrinfo() does not expose record TTLs, so entries use a fixed lifetime
+_MAX_TTL_SECONDS = 900.0
+# Hits with less than this left trigger a background refresh
+_REFRESH_WINDOW_SECONDS = 60.0
+
+
+class TTLResolver(CachingThreadedResolver):
+    """
+    CachingThreadedResolver whose entries expire after DNSCACHE_TTL seconds.
+
+    Scrapy's stock cache keeps entries forever, so long crawls keep hitting
+    stale load-balancer IPs. Hits that are close to expiry are still served
+    from cache while a refresh runs on the reactor threadpool.
+    """
+
+    def __init__(self, reactor, cache_size: int, timeout: float, ttl: float):
+        super().__init__(reactor, cache_size, timeout)
+        self.ttl = min(ttl, _MAX_TTL_SECONDS)
+        self._expiry = LocalCache(cache_size)
+        self._refreshing = set()
+
+    @classmethod
+    def from_crawler(cls, crawler, reactor):
+        if crawler.settings.getbool("DNSCACHE_ENABLED"):
+            cache_size = crawler.settings.getint("DNSCACHE_SIZE")
+        else:
+            cache_size = 0
+        return cls(
+            reactor,
+            cache_size,
+            crawler.settings.getfloat("DNS_TIMEOUT"),
+            crawler.settings.getfloat("DNSCACHE_TTL", _MAX_TTL_SECONDS),
+        )
+
+    def getHostByName(self, name: str, timeout=()):
+        if name in dnscache:
+            remaining = self._expiry.get(name, 0.0) - time.monotonic()
+            if remaining > 0:
+                cached = dnscache[name]
+                if remaining < _REFRESH_WINDOW_SECONDS and name not in self._refreshing:
+                    self._refresh(name)
+                return defer.succeed(cached)
+            del dnscache[name]
+        return super().getHostByName(name, timeout)
+
+    def prefetch(self, name: str) -> None:
+        """Start resolving name in the background so a later request hits the cache."""
+        if dnscache.limit and name not in dnscache and name not in self._refreshing:
+            self._refresh(name)
+
+    def _cache_result(self, result, name: str):
+        self._expiry[name] = time.monotonic() + self.ttl
+        return super()._cache_result(result, name)
+
+    def _refresh(self, name: str) -> None:
+        """Re-resolve name off the hot path; the cached entry keeps serving meanwhile."""
+        self._refreshing.add(name)
+        d = ThreadedResolver.getHostByName(self, name, (self.timeout,))
+        d.addCallback(self._cache_result, name)
+        d.addErrback(lambda _failure: None)  # Entry simply expires on failure
+        d.addBoth(lambda _: self._refreshing.discard(name))
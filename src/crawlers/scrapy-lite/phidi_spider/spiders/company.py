@@ -5,11 +5,17 @@ Reuses existing extraction logic to maintain consistency with Python/Node crawle
 """
 import csv
 import sys
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, Optional, Dict, Any
+from typing import Generator, Iterator, List, Optional, Dict, Any
 
 import scrapy
 from scrapy.http import Response, HtmlResponse
+from scrapy.utils.defer import maybe_deferred_to_future
+from twisted.internet.threads import deferToThread
+from w3lib.encoding import html_to_unicode, resolve_encoding
 
 # Add repo root to path for imports
 _repo_root = Path(__file__).resolve().parents[5]
@@ -28,6 +34,76 @@ from src.crawlers.python.extract import (
 )
 from src.common.domain_utils import clean_domain
 
+# Input lists often repeat domains; cache the canonicalization
+clean_domain = lru_cache(maxsize=65536)(clean_domain)
+
+
+_HEADER_NAMES = ('domain', 'domains', 'website', 'url')
+
+# Requests are held back this far behind input so their DNS lookups run ahead
+_DNS_PREFETCH_AHEAD = 256
+
+
+def _iter_input_values(input_path: Path) -> Iterator[str]:
+    """
+    Yield the first-column value of each non-blank input row, skipping a header.
+    
+    One-domain-per-line files (the common case) are read as plain lines;
+    csv.reader is only used when the sample shows delimiters or quoting.
+    """
+    with input_path.open('rb') as f:
+        sample = f.read(1024)
+    
+    if b',' not in sample and b'"' not in sample:
+        with input_path.open('rb') as f:
+            for idx, raw_line in enumerate(f):
+                value = raw_line.strip()
+                if idx == 0:
+                    value = value.lstrip(b'\xef\xbb\xbf')  # UTF-8 BOM
+                    if value.decode('utf-8', 'ignore').lower() in _HEADER_NAMES:
+                        continue
+                if value:
+                    yield value.decode('utf-8', 'ignore')
+        return
+    
+    with input_path.open('r', encoding='utf-8-sig', newline='') as f:
+        # Peek at first line to detect header
+        first_line = f.readline().strip()
+        f.seek(0)
+        
+        # Skip header if present
+        if first_line.lower() in _HEADER_NAMES:
+            next(f)
+        
+        for row in csv.reader(f):
+            if row and row[0].strip():
+                yield row[0].strip()
+
+
+# Field length caps: keep a bogus extractor hit from bloating the NDJSON line
+_MAX_ADDR = 512
+_MAX_NAME = 256
+_MAX_URL = 1024
+
+
+@dataclass(slots=True)
+class CompanyRecord:
+    """One output line; field order matches the Python/Node crawler NDJSON."""
+    domain: str
+    company_name: Optional[str] = None
+    phones: List[str] = field(default_factory=list)
+    facebook: Optional[str] = None
+    linkedin: Optional[str] = None
+    twitter: Optional[str] = None
+    instagram: Optional[str] = None
+    address: Optional[str] = None
+    status_code: Optional[int] = None
+    final_url: Optional[str] = None
+    crawled: bool = True
+    response_time_ms: Optional[int] = None
+    error: Optional[str] = None
+    error_message: Optional[str] = None
+
 
 def _build_record(domain: str, final_url: str, status: Optional[int], *, phones: Optional[list] = None,
                   company_name: Optional[str] = None,
@@ -35,22 +111,57 @@ def _build_record(domain: str, final_url: str, status: Optional[int], *, phones:
                   twitter: Optional[str] = None, instagram: Optional[str] = None,
                   address: Optional[str] = None, crawled: bool = True,
                   response_time_ms: Optional[int] = None,
-                  error: Optional[str] = None, error_message: Optional[str] = None) -> Dict[str, Any]:
+                  error: Optional[str] = None, error_message: Optional[str] = None) -> CompanyRecord:
+    return CompanyRecord(
+        domain,
+        company_name[:_MAX_NAME] if company_name else company_name,
+        phones or [],
+        facebook[:_MAX_URL] if facebook else facebook,
+        linkedin[:_MAX_URL] if linkedin else linkedin,
+        twitter[:_MAX_URL] if twitter else twitter,
+        instagram[:_MAX_URL] if instagram else instagram,
+        address[:_MAX_ADDR] if address else address,
+        status,
+        final_url[:_MAX_URL] if final_url else final_url,
+        crawled,
+        response_time_ms,
+        error or None,
+        error_message or None,
+    )
+
+
+# TextResponse's fallback when neither headers, BOM nor <meta> declare a charset
+_DEFAULT_ENCODING = 'ascii'
+
+
+def _auto_detect_encoding(body: bytes) -> Optional[str]:
+    """Mirror TextResponse._auto_detect_fun for bodies without a declared charset."""
+    for enc in (_DEFAULT_ENCODING, 'utf-8', 'cp1252'):
+        try:
+            body.decode(enc)
+        except UnicodeError:
+            continue
+        return resolve_encoding(enc)
+    return None
+
+
+def _extract_fields(body: bytes, content_type: str) -> Dict[str, Any]:
+    """Decode the body and run all shared extractors (executed off the reactor thread)."""
+    # Same decoding as TextResponse.text, but paid once and on the worker thread
+    html = html_to_unicode(
+        content_type,
+        body,
+        auto_detect_fun=_auto_detect_encoding,
+        default_encoding=_DEFAULT_ENCODING,
+    )[1]
     return {
-        'domain': domain,
-        'company_name': company_name,
-        'phones': phones or [],
-        'facebook': facebook,
-        'linkedin': linkedin,
-        'twitter': twitter,
-        'instagram': instagram,
-        'address': address,
-        'status_code': status,
-        'final_url': final_url,
-        'crawled': crawled,
-        'response_time_ms': response_time_ms,
-        **({'error': error} if error else {}),
-        **({'error_message': error_message} if error_message else {}),
+        'company_name': extract_company_name(html),
+        'phones': extract_phones(html),
+        'facebook': extract_facebook(html),
+        'linkedin': extract_linkedin(html),
+        'twitter': extract_twitter(html),
+        'instagram': extract_instagram(html),
+        'address': extract_address(html),
     }
 
 
@@ -93,60 +204,60 @@ class CompanySpider(scrapy.Spider):
         
         self.logger.info(f"Reading domains from: {input_path}")
         
-        with input_path.open('r', encoding='utf-8-sig', newline='') as f:
-            # Peek at first line to detect header
-            first_line = f.readline().strip()
-            f.seek(0)
+        domain_count = 0
+        # TTLResolver (settings.DNS_RESOLVER) can warm its cache ahead of requests.
+        # Imported here: a module-level import would install the default reactor.
+        from twisted.internet import reactor
+        prefetch = getattr(getattr(reactor, 'resolver', None), 'prefetch', None)
+        pending = deque()
+        
+        for raw_domain in _iter_input_values(input_path):
+            domain = clean_domain(raw_domain)
             
-            # Skip header if present
-            if first_line.lower() in ('domain', 'domains', 'website', 'url'):
-                next(f)
+            if not domain:
+                self.logger.warning("Invalid domain skipped: %s", raw_domain)
+                continue
             
-            reader = csv.reader(f)
-            domain_count = 0
+            domain_count += 1
             
-            for row in reader:
-                if not row or not row[0].strip():
-                    continue
-                
-                raw_domain = row[0].strip()
-                domain = clean_domain(raw_domain)
-                
-                if not domain:
-                    self.logger.warning(f"Invalid domain skipped: {raw_domain}")
-                    continue
-                
-                domain_count += 1
-                
-                # Try HTTPS first (Scrapy will handle retries and fallback via middleware)
-                url = f"https://{domain}"
-                
-                yield scrapy.Request(
-                    url=url,
-                    callback=self.parse,
-                    errback=self.handle_error,
-                    meta={
-                        'domain': domain,
-                        'original_input': raw_domain
-                    },
-                    dont_filter=False  # Allow deduplication
-                )
+            # Try HTTPS first (Scrapy will handle retries and fallback via middleware)
+            url = f"https://{domain}"
             
-            self.logger.info(f"Generated {domain_count} requests from {input_path}")
+            if prefetch is not None:
+                prefetch(domain.partition(':')[0])
+            
+            pending.append(scrapy.Request(
+                url=url,
+                callback=self.parse,
+                errback=self.handle_error,
+                meta={
+                    'domain': domain,
+                    'original_input': raw_domain
+                },
+                dont_filter=False  # Allow deduplication
+            ))
+            if len(pending) > _DNS_PREFETCH_AHEAD:
+                yield pending.popleft()
+        
+        while pending:
+            yield pending.popleft()
+        
+        self.logger.info(f"Generated {domain_count} requests from {input_path}")
     
-    def parse(self, response: Response) -> Dict[str, Any]:
+    async def parse(self, response: Response) -> CompanyRecord:
         """
         Extract company data from HTML response.
         Reuses existing extraction functions for consistency.
+        
+        Extraction runs in the reactor threadpool so the reactor keeps
+        servicing downloads while a large page is being scanned.
         """
-        domain = response.meta.get('domain', '')
+        meta = response.meta
+        domain = meta.get('domain', '')
         if not isinstance(response, HtmlResponse):
-            self.logger.warning(f"Non-HTML response for {domain} ({response.url}); skipping")
-            raw_ct = response.headers.get('Content-Type', b'')
-            if isinstance(raw_ct, bytes):
-                ctype = raw_ct.decode('utf-8', errors='ignore')
-            else:
-                ctype = str(raw_ct) if raw_ct else ''
+            self.logger.warning("Non-HTML response for %s (%s); skipping", domain, response.url)
+            # Scrapy header values are always bytes
+            ctype = (response.headers.get(b'Content-Type') or b'').decode('latin-1')
             return _build_record(
                 domain,
                 response.url,
@@ -157,42 +268,30 @@ class CompanySpider(scrapy.Spider):
                 error_message=f'content_type={ctype}' if ctype else 'binary response'
             )
 
-        html = response.text
-        
         # Capture response time (download_latency is in seconds, convert to ms)
-        download_latency = response.meta.get('download_latency', 0)
-        response_time_ms = int(download_latency * 1000)
-        
-        # Extract data using shared utilities
-        company_name = extract_company_name(html)
-        phones = extract_phones(html)
-        facebook = extract_facebook(html)
-        linkedin = extract_linkedin(html)
-        twitter = extract_twitter(html)
-        instagram = extract_instagram(html)
-        address = extract_address(html)
+        response_time_ms = round(meta.get('download_latency', 0.0) * 1000)
+        
+        # Extract data using shared utilities; response.encoding/.text would decode on the reactor
+        content_type = (response.headers.get(b'Content-Type') or b'').decode('latin-1')
+        fields = await maybe_deferred_to_future(
+            deferToThread(_extract_fields, response.body, content_type)
+        )
         
         # Build result in same format as Python/Node crawlers
         result = _build_record(
             domain,
             response.url,
             response.status,
-            phones=phones,
-            company_name=company_name,
-            facebook=facebook,
-            linkedin=linkedin,
-            twitter=twitter,
-            instagram=instagram,
-            address=address,
+            **fields,
             response_time_ms=response_time_ms,
             crawled=True,
         )
         
-        self.logger.debug(f"Extracted data from {domain}: {len(phones)} phones, address={bool(address)}")
+        self.logger.debug("Extracted data from %s: %d phones, address=%s", domain, len(fields['phones']), bool(fields['address']))
         
         return result
     
-    def handle_error(self, failure) -> Dict[str, Any]:
+    def handle_error(self, failure) -> CompanyRecord:
         """
         Handle crawl errors gracefully.
         Returns error record in same format as successful crawls.
@@ -207,7 +306,7 @@ class CompanySpider(scrapy.Spider):
         if len(error_msg) > 200:
             error_msg = error_msg[:200] + '...'
         
-        self.logger.warning(f"Failed to crawl {domain}: {error_type} - {error_msg}")
+        self.logger.warning("Failed to crawl %s: %s - %s", domain, error_type, error_msg)
         
         return _build_record(
             domain,
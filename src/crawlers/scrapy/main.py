@@ -77,9 +77,8 @@ Examples:
     # Load config with profile support
     config = _load_config(args.profile)
 
-    domains = _load_domains(input_path)
-    total_domains = len(domains)
-    del domains
+    # Cheap line count for the banner; the spider streams the file itself
+    total_domains = _count_domains(input_path)
     
     # Import Scrapy here (after arg parsing) to show usage errors quickly
     try:
@@ -211,34 +210,26 @@ def _load_config(profile=None):
         return None
 
 
-def _load_domains(csv_path: Path):
+def _count_domains(csv_path: Path) -> int:
+    """Count non-blank input lines, minus a header row, without parsing the CSV."""
     try:
-        from src.crawlers.python.main import load_domains
-        return load_domains(csv_path)
-    except Exception:
-        domains = []
-        try:
-            import csv
-            with csv_path.open('r', encoding='utf-8-sig', newline='') as f:
-                reader = csv.reader(f)
-                for idx, row in enumerate(reader):
-                    if not row:
-                        continue
-                    value = row[0].strip()
-                    if idx == 0 and value.lower() == 'domain':
-                        continue
-                    if value:
-                        domains.append(value)
-        except Exception:
-            pass
-        return domains
+        with csv_path.open('rb') as f:
+            first = f.readline().strip()
+            count = sum(1 for line in f if line.strip())
+    except OSError:
+        return 0
+    header = first.decode('utf-8-sig', errors='ignore').lower()
+    if first and header not in ('domain', 'domains', 'website', 'url'):
+        count += 1
+    return count
 
 
 def _count_records(output_path: Path) -> int:
+    # The pipeline ends every NDJSON record with exactly one newline
     try:
-        with output_path.open('r', encoding='utf-8') as f:
-            return sum(1 for line in f if line.strip())
-    except Exception:
+        with output_path.open('rb') as f:
+            return sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+    except OSError:
         return 0
 
 
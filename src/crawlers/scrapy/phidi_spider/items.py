@@ -3,11 +3,12 @@ Scrapy Items for company data extraction.
 Defines data structures with field processors for normalization.
 """
 import sys
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import List, Optional
 
 import scrapy
-from itemloaders.processors import TakeFirst, MapCompose, Join, Compose
+from itemloaders.processors import TakeFirst, MapCompose, Join
 
 # Add repo root to path
 _repo_root = Path(__file__).resolve().parents[4]
@@ -24,11 +25,6 @@ from src.common.social_utils import (
 from src.common.normalize_utils import normalize_address
 
 
-def _filter_empty(values: List[str]) -> List[str]:
-    """Remove empty strings and None values."""
-    return [v for v in values if v and v.strip()]
-
-
 def _clean_phone(value: str) -> str:
     """Clean phone from tel: link or raw text."""
     if value.startswith('tel:'):
@@ -36,30 +32,42 @@ def _clean_phone(value: str) -> str:
     return value.strip()
 
 
-def _deduplicate_phones(phones: List[str]) -> List[str]:
-    """Normalize and deduplicate phone numbers."""
+def _normalize_phones(values: List[str]) -> List[str]:
+    """Drop empties, normalize and deduplicate phone numbers in one pass."""
     normalized = []
     seen = set()
-    for phone in phones:
-        norm = normalize_phone(phone)
+    for value in values:
+        if not value:
+            continue
+        value = value.strip()
+        if not value:
+            continue
+        norm = normalize_phone(value)
         if norm and norm not in seen:
             normalized.append(norm)
             seen.add(norm)
     return normalized
 
 
+@lru_cache(maxsize=8192)
+def _normalize_address_text(text: str) -> Optional[str]:
+    """Normalize a stripped address string (cached: chains/franchises repeat addresses)."""
+    # normalize_address may return dict or str, convert dict to string
+    normalized = normalize_address(text)
+    if isinstance(normalized, dict):
+        # Join dict values into a string
+        return ' '.join(str(v) for v in normalized.values() if v)
+    elif isinstance(normalized, str):
+        return normalized
+    return None
+
+
 def _normalize_address_field(value) -> Optional[str]:
     """Normalize address value - handle strings and skip non-strings."""
     if isinstance(value, str):
         stripped = value.strip()
         if stripped:
-            # normalize_address may return dict or str, convert dict to string
-            normalized = normalize_address(stripped)
-            if isinstance(normalized, dict):
-                # Join dict values into a string
-                return ' '.join(str(v) for v in normalized.values() if v)
-            elif isinstance(normalized, str):
-                return normalized
+            return _normalize_address_text(stripped)
     return None
 
 
@@ -73,9 +81,8 @@ def _first_valid_address(values: List) -> Optional[str]:
 
 
 def _first_or_none(values: List[str]) -> Optional[str]:
-    """Take first non-empty value or None."""
-    filtered = _filter_empty(values)
-    return filtered[0] if filtered else None
+    """Take first non-empty value or None (stops at the first hit)."""
+    return next((v for v in values if v and v.strip()), None)
 
 
 def _canonicalize_social(url: str, platform: str) -> Optional[str]:
@@ -125,21 +132,21 @@ class CompanyItem(scrapy.Item):
     
     phones = scrapy.Field(
         input_processor=MapCompose(str.strip, _clean_phone),
-        output_processor=Compose(_filter_empty, _deduplicate_phones)
+        output_processor=_normalize_phones
     )
     
     facebook = scrapy.Field(
-        input_processor=MapCompose(str.strip, lambda x: _canonicalize_social(x, 'facebook')),
+        input_processor=MapCompose(str.strip, partial(_canonicalize_social, platform='facebook')),
         output_processor=_first_or_none
     )
     
     linkedin = scrapy.Field(
-        input_processor=MapCompose(str.strip, lambda x: _canonicalize_social(x, 'linkedin')),
+        input_processor=MapCompose(str.strip, partial(_canonicalize_social, platform='linkedin')),
         output_processor=_first_or_none
     )
     
     twitter = scrapy.Field(
-        input_processor=MapCompose(str.strip, lambda x: _canonicalize_social(x, 'twitter')),
+        input_processor=MapCompose(str.strip, partial(_canonicalize_social, platform='twitter')),
         output_processor=_first_or_none
     )
     
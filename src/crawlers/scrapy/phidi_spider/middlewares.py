@@ -1,7 +1,33 @@
 """Custom Scrapy middlewares for Phidi crawler."""
+import random
+import re
 import sys
 from pathlib import Path
 
+from scrapy import signals
+from scrapy.exceptions import StopDownload
+from twisted.internet.error import SSLError as _TwistedSSLError
+
+try:
+    from OpenSSL.SSL import Error as _OpenSSLError
+    _SSL_ERROR_TYPES = (_TwistedSSLError, _OpenSSLError)
+except ImportError:  # pragma: no cover - pyOpenSSL ships with Scrapy
+    _SSL_ERROR_TYPES = (_TwistedSSLError,)
+
+# Fallback for wrapped failures (e.g. ResponseNeverReceived around a TLS error)
+_SSL_ERROR_RE = re.compile(r'certificate|ssl|handshake|tls', re.IGNORECASE)
+
+# Content-Type prefixes that are never HTML; generic types (octet-stream, empty)
+# still download so Scrapy can sniff mislabelled HTML bodies
+_NON_HTML_CONTENT_TYPES = (
+    b'image/', b'video/', b'audio/', b'font/',
+    b'application/pdf', b'application/zip', b'application/gzip',
+    b'application/x-gzip', b'application/x-tar', b'application/x-7z',
+    b'application/x-rar', b'application/msword', b'application/vnd.ms-',
+    b'application/vnd.openxmlformats', b'application/vnd.oasis',
+    b'application/font', b'application/x-font',
+)
+
 # Add repo root to path
 _repo_root = Path(__file__).resolve().parents[4]
 if str(_repo_root) not in sys.path:
@@ -16,6 +42,8 @@ class UserAgentRotationMiddleware:
     
     def __init__(self):
         self.rotator = None
+        # Header values pre-encoded once; each request just picks one
+        self.user_agents = ()
         try:
             from src.common.user_agent_rotation import UserAgentRotator
             from src.common.crawler_config import load_crawler_config
@@ -26,14 +54,15 @@ class UserAgentRotationMiddleware:
                     identify=config.user_agent_rotation.identify,
                     identifier="PhidiCrawler/1.0"
                 )
+                self.user_agents = tuple(ua.encode('latin-1') for ua in self.rotator.get_all())
         except Exception:
             # Fallback: no rotation
             pass
     
     def process_request(self, request, spider):
         """Inject rotated user-agent into each request."""
-        if self.rotator:
-            request.headers['User-Agent'] = self.rotator.get_random()
+        if self.user_agents:
+            request.headers[b'User-Agent'] = random.choice(self.user_agents)
         return None
 
 
@@ -45,7 +74,6 @@ class HttpFallbackMiddleware:
     
     def __init__(self):
         self.fallback_enabled = True
-        self.ssl_error_codes = {'certificate', 'ssl', 'handshake', 'tls'}
         try:
             from src.common.crawler_config import load_crawler_config
             config = load_crawler_config()
@@ -66,14 +94,16 @@ class HttpFallbackMiddleware:
         if not self.fallback_enabled:
             return None
         
-        # Check if this is an SSL-related error
-        error_msg = str(exception).lower()
-        is_ssl_error = any(code in error_msg for code in self.ssl_error_codes)
+        # Check if this is an SSL-related error: class check first, message scan as fallback
+        is_ssl_error = (
+            isinstance(exception, _SSL_ERROR_TYPES)
+            or _SSL_ERROR_RE.search(str(exception)) is not None
+        )
         
         if is_ssl_error and request.url.startswith('https://'):
             # Convert to HTTP and retry
             http_url = request.url.replace('https://', 'http://', 1)
-            spider.logger.debug(f"SSL error on {request.url}, retrying with HTTP: {http_url}")
+            spider.logger.debug("SSL error on %s, retrying with HTTP: %s", request.url, http_url)
             
             return request.replace(
                 url=http_url,
@@ -82,3 +112,25 @@ class HttpFallbackMiddleware:
             )
         
         return None
+
+
+class ContentTypeFilterMiddleware:
+    """
+    Stops downloading known non-HTML bodies (PDFs, images, archives) as soon as
+    the response headers arrive. The spider still receives the empty-bodied
+    response and records it as a non-HTML skip.
+    """
+    
+    @classmethod
+    def from_crawler(cls, crawler):
+        middleware = cls()
+        crawler.signals.connect(middleware.headers_received, signal=signals.headers_received)
+        return middleware
+    
+    def headers_received(self, headers, body_length, request, spider):
+        # Only page requests carry a domain; leave robots.txt and friends alone
+        if 'domain' not in request.meta:
+            return
+        content_type = headers.get(b'Content-Type')
+        if content_type and content_type.strip().lower().startswith(_NON_HTML_CONTENT_TYPES):
+            raise StopDownload(fail=False)
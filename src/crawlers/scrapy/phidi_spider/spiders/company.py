@@ -4,12 +4,15 @@ Uses CSS/XPath selectors and ItemLoaders following Scrapy best practices.
 Implements extraction logic independently from regex-based crawlers for comparison.
 """
 import csv
+from collections import deque
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, Iterator, Optional
 
 import scrapy
+from lxml import etree
 from scrapy.http import Response, HtmlResponse
 from scrapy.loader import ItemLoader
 
@@ -21,6 +24,112 @@ if str(_repo_root) not in sys.path:
 from phidi_spider.items import CompanyItem
 from src.common.domain_utils import clean_domain
 
+# Input lists often repeat domains; cache the canonicalization
+clean_domain = lru_cache(maxsize=65536)(clean_domain)
+
+
+# Selectors compiled once at import instead of on every add_xpath/add_css call.
+# smart_strings=False returns plain str results that don't pin the parsed tree.
+def _xpath(expr: str) -> etree.XPath:
+    return etree.XPath(expr, smart_strings=False)
+
+
+_XP_OG_SITE = _xpath('//meta[@property="og:site_name"]/@content')
+_XP_TITLE = _xpath('//title/text()')
+_XP_H1 = _xpath('//h1/text()')  # CSS: h1::text
+_XP_HREFS = _xpath('//a/@href')
+_XP_PARAGRAPHS = _xpath('//p')
+# Paragraphs mentioning any of these (case-insensitive) are scanned for phones
+_PHONE_CONTEXT_WORDS = ('phone', 'call', 'tel', 'contact')
+# Cheap linear prefilter: _phone_pattern needs at least six digits to match,
+# so texts with fewer skip the backtracking findall()
+_HAS_PHONE_DIGITS = re.compile(r'(?:\d\D*){5}\d').search
+# (field, href substrings) for classifying links in one pass over //a/@href.
+# Checks are independent, as with the per-platform contains() XPaths before.
+_SOCIAL_NEEDLES = (
+    ('facebook', ('facebook.com', 'fb.com')),
+    ('linkedin', ('linkedin.com/company/', 'linkedin.com/in/')),
+    ('twitter', ('twitter.com', 'x.com')),
+    ('instagram', ('instagram.com',)),
+)
+# Every needle above contains this, so hrefs without it (relative links,
+# mailto:, anchors) skip the per-platform scans
+_SOCIAL_GATE = '.com'
+_ADDR_DIV_CLASSES = ('address', 'location', 'contact')
+# CSS/JS fragments that disqualify an address candidate (one scan, no .lower())
+_NOISE_RE = re.compile(r'@media|function|var |[{};]', re.IGNORECASE)
+
+
+def _address_texts(root) -> list:
+    """
+    Text of <address> tags followed by text under address-like divs.
+
+    One iterwalk over <address>/<div> replaces the former //address/text()
+    and //div[contains(@class, ...)]//text() passes, in the same order:
+    direct text of every <address>, then descendant text of the outermost
+    matching divs (nested matches are covered by their ancestor).
+    """
+    tag_texts = []
+    div_texts = []
+    open_divs = 0
+    for event, el in etree.iterwalk(root, events=('start', 'end'), tag=('address', 'div')):
+        if el.tag == 'address':
+            if event == 'start':
+                tag_texts.extend(t for t in [el.text, *(child.tail for child in el)] if t)
+            continue
+        cls = el.get('class')
+        if not cls or not any(c in cls for c in _ADDR_DIV_CLASSES):
+            continue
+        if event == 'start':
+            if not open_divs:
+                div_texts.extend(el.itertext())
+            open_divs += 1
+        else:
+            open_divs -= 1
+    tag_texts.extend(div_texts)
+    return tag_texts
+
+_HEADER_NAMES = ('domain', 'domains', 'website', 'url')
+
+# Requests are held back this far behind input so their DNS lookups run ahead
+_DNS_PREFETCH_AHEAD = 256
+
+
+def _iter_input_values(input_path: Path) -> Iterator[str]:
+    """
+    Yield the first-column value of each non-blank input row, skipping a header.
+    
+    One-domain-per-line files (the common case) are read as plain lines;
+    csv.reader is only used when the sample shows delimiters or quoting.
+    """
+    with input_path.open('rb') as f:
+        sample = f.read(1024)
+    
+    if b',' not in sample and b'"' not in sample:
+        with input_path.open('rb') as f:
+            for idx, raw_line in enumerate(f):
+                value = raw_line.strip()
+                if idx == 0:
+                    value = value.lstrip(b'\xef\xbb\xbf')  # UTF-8 BOM
+                    if value.decode('utf-8', 'ignore').lower() in _HEADER_NAMES:
+                        continue
+                if value:
+                    yield value.decode('utf-8', 'ignore')
+        return
+    
+    with input_path.open('r', encoding='utf-8-sig', newline='') as f:
+        # Peek at first line to detect header
+        first_line = f.readline().strip()
+        f.seek(0)
+        
+        # Skip header if present
+        if first_line.lower() in _HEADER_NAMES:
+            next(f)
+        
+        for row in csv.reader(f):
+            if row and row[0].strip():
+                yield row[0].strip()
+
 
 class CompanySpider(scrapy.Spider):
     """
@@ -70,51 +179,51 @@ class CompanySpider(scrapy.Spider):
         
         self.logger.info(f"Reading domains from: {input_path}")
         
-        with input_path.open('r', encoding='utf-8-sig', newline='') as f:
-            # Peek at first line to detect header
-            first_line = f.readline().strip()
-            f.seek(0)
+        domain_count = 0
+        # TTLResolver (settings.DNS_RESOLVER) can warm its cache ahead of requests.
+        # Imported here: a module-level import would install the default reactor.
+        from twisted.internet import reactor
+        prefetch = getattr(getattr(reactor, 'resolver', None), 'prefetch', None)
+        pending = deque()
+        
+        for raw_domain in _iter_input_values(input_path):
+            domain = clean_domain(raw_domain)
             
-            # Skip header if present
-            if first_line.lower() in ('domain', 'domains', 'website', 'url'):
-                next(f)
+            if not domain:
+                self.logger.warning("Invalid domain skipped: %s", raw_domain)
+                continue
             
-            reader = csv.reader(f)
-            domain_count = 0
+            domain_count += 1
+            url = f"https://{domain}"
             
-            for row in reader:
-                if not row or not row[0].strip():
-                    continue
-                
-                raw_domain = row[0].strip()
-                domain = clean_domain(raw_domain)
-                
-                if not domain:
-                    self.logger.warning(f"Invalid domain skipped: {raw_domain}")
-                    continue
-                
-                domain_count += 1
-                url = f"https://{domain}"
-                
-                yield scrapy.Request(
-                    url=url,
-                    callback=self.parse,
-                    errback=self.handle_error,
-                    meta={
-                        'domain': domain,
-                        'original_input': raw_domain
-                    },
-                    dont_filter=False
-                )
+            if prefetch is not None:
+                prefetch(domain.partition(':')[0])
             
-            self.logger.info(f"Generated {domain_count} requests")
+            pending.append(scrapy.Request(
+                url=url,
+                callback=self.parse,
+                errback=self.handle_error,
+                meta={
+                    'domain': domain,
+                    'original_input': raw_domain
+                },
+                dont_filter=False
+            ))
+            if len(pending) > _DNS_PREFETCH_AHEAD:
+                yield pending.popleft()
+        
+        while pending:
+            yield pending.popleft()
+        
+        self.logger.info(f"Generated {domain_count} requests")
     
     def parse(self, response: Response):
         """
         Extract company data using native Scrapy selectors.
         Uses CSS/XPath for structured extraction.
         """
-        domain = response.meta.get('domain', '')
+        meta = response.meta
+        domain = meta.get('domain', '')
         
         if not isinstance(response, HtmlResponse):
             # Non-HTML response
@@ -124,7 +233,9 @@ class CompanySpider(scrapy.Spider):
                 error_message='Response is not HTML'
             )
         
-        loader = ItemLoader(item=CompanyItem(), response=response)
+        # The loader gets no response: its own Selector would re-parse the page
+        loader = ItemLoader(item=CompanyItem())
+        root = response.selector.root
         
         # Set metadata
         loader.add_value('domain', domain)
@@ -133,74 +244,58 @@ class CompanySpider(scrapy.Spider):
         loader.add_value('crawled', True)
         
         # Capture response time (download_latency is in seconds, convert to ms)
-        download_latency = response.meta.get('download_latency', 0)
-        response_time_ms = int(download_latency * 1000)
+        response_time_ms = round(meta.get('download_latency', 0.0) * 1000)
         loader.add_value('response_time_ms', response_time_ms)
         
         # Extract company name
         # Priority: og:site_name > title > h1
-        loader.add_xpath('company_name', '//meta[@property="og:site_name"]/@content')
-        loader.add_xpath('company_name', '//title/text()')
-        loader.add_css('company_name', 'h1::text')
+        loader.add_value('company_name', _XP_OG_SITE(root))
+        loader.add_value('company_name', _XP_TITLE(root))
+        loader.add_value('company_name', _XP_H1(root))
+        
+        # Walk every link once: tel: hrefs feed phones, the rest is classified by platform
+        tel_links = []
+        social_links = {field: [] for field, _ in _SOCIAL_NEEDLES}
+        for href in _XP_HREFS(root):
+            if href.startswith('tel:'):
+                tel_links.append(href)
+            if _SOCIAL_GATE not in href:
+                continue
+            for field, needles in _SOCIAL_NEEDLES:
+                if any(needle in href for needle in needles):
+                    social_links[field].append(href)
         
         # Extract phones
         # 1. From tel: links
-        loader.add_xpath('phones', '//a[starts-with(@href, "tel:")]/@href')
-        # 2. From text containing phone patterns
-        phone_texts = response.xpath(
-            '//p[contains(translate(., "PHNEOTLCA", "phneotlca"), "phone") or '
-            'contains(translate(., "PHNEOTLCA", "phneotlca"), "call") or '
-            'contains(translate(., "PHNEOTLCA", "phneotlca"), "tel") or '
-            'contains(translate(., "PHNEOTLCA", "phneotlca"), "contact")]//text()'
-        ).getall()
-        for text in phone_texts:
-            matches = self._phone_pattern.findall(text)
-            for match in matches:
-                loader.add_value('phones', match)
-        
-        # Extract Facebook
-        loader.add_xpath(
-            'facebook',
-            '//a[contains(@href, "facebook.com") or contains(@href, "fb.com")]/@href'
-        )
-        
-        # Extract LinkedIn
-        loader.add_xpath(
-            'linkedin',
-            '//a[contains(@href, "linkedin.com/company/") or contains(@href, "linkedin.com/in/")]/@href'
-        )
-        
-        # Extract Twitter/X
-        loader.add_xpath(
-            'twitter',
-            '//a[contains(@href, "twitter.com") or contains(@href, "x.com")]/@href'
-        )
+        loader.add_value('phones', tel_links)
+        # 2. From text of paragraphs that mention phone/call/tel/contact
+        # (lowercased once per paragraph rather than translate()d per keyword)
+        for paragraph in _XP_PARAGRAPHS(root):
+            texts = list(paragraph.itertext())
+            lowered = ''.join(texts).lower()
+            if not any(word in lowered for word in _PHONE_CONTEXT_WORDS):
+                continue
+            for text in texts:
+                if not _HAS_PHONE_DIGITS(text):
+                    continue
+                for match in self._phone_pattern.findall(text):
+                    loader.add_value('phones', match)
         
-        # Extract Instagram
-        loader.add_xpath(
-            'instagram',
-            '//a[contains(@href, "instagram.com")]/@href'
-        )
+        # Extract social links
+        for field, links in social_links.items():
+            loader.add_value(field, links)
         
         # Extract address
         # Extract all address-related text and let the processor normalize it
-        address_texts = []
-        
-        # 1. From address tag
-        address_texts.extend(response.css('address::text').getall())
-        
-        # 2. From common CSS classes
-        address_texts.extend(response.xpath(
-            '//div[contains(@class, "address") or contains(@class, "location") or '
-            'contains(@class, "contact")]//text()'
-        ).getall())
+        # 1. From address tags, 2. from common CSS classes (one DOM walk)
+        address_texts = _address_texts(root)
         
         # 3. Filter and add to loader (skip CSS/JS and very short strings)
         for text in address_texts:
             if text and text.strip():
                 clean_text = text.strip()
                 # Skip CSS, JS, and other noise
-                if len(clean_text) > 10 and not any(x in clean_text.lower() for x in ['@media', 'function', 'var ', '{', '}', ';']):
+                if len(clean_text) > 10 and not _NOISE_RE.search(clean_text):
                     loader.add_value('address', clean_text)
         
         return loader.load_item()
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import argparse
-import json
-from collections import defaultdict
 from pathlib import Path
 import sys
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
 try:
 	from src.common.console import Console
+	from src.etl.ndjson_io import read_ndjson, write_ndjson
 except Exception:  # pragma: no cover - fallback when run as a script
 	import sys as _sys
 	from pathlib import Path as _Path
@@ -15,47 +15,37 @@ except Exception:  # pragma: no cover - fallback when run as a script
 	if str(_repo_root) not in _sys.path:
 		_sys.path.insert(0, str(_repo_root))
 	from src.common.console import Console  # type: ignore
-
-
-def read_ndjson(path: Path) -> Iterable[Dict]:
-	with path.open("r", encoding="utf-8") as f:
-		for line in f:
-			line = line.strip()
-			if not line:
-				continue
-			try:
-				yield json.loads(line)
-			except json.JSONDecodeError:
-				continue
-
-
-def write_ndjson(path: Path, records: Iterable[Dict]) -> None:
-	path.parent.mkdir(parents=True, exist_ok=True)
-	with path.open("w", encoding="utf-8") as f:
-		for rec in records:
-			f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+	from src.etl.ndjson_io import read_ndjson, write_ndjson  # type: ignore
 
 
 def completeness_score(r: Dict) -> int:
 	# Similar heuristic as the example: phones count + presence of socials + address presence
-	return int(bool(r.get("address"))) + int(bool(r.get("facebook"))) + int(bool(r.get("linkedin"))) + int(bool(r.get("twitter"))) + len(r.get("phones") or [])
+	get = r.get
+	return bool(get("address")) + bool(get("facebook")) + bool(get("linkedin")) + bool(get("twitter")) + len(get("phones") or ())
+
+
+# Boolean fields counted by completeness_score (address + three socials)
+_MAX_FLAGS = 4
 
 
 def dedupe_by_domain(records: Iterable[Dict]) -> List[Dict]:
-	groups: Dict[str, List[Dict]] = defaultdict(list)
+	# Single pass keeping only the current best (score, record) per domain.
+	# Ties keep the first record seen, and output follows first-seen domain order.
+	winners: Dict[str, Tuple[int, Dict]] = {}
 	for r in records:
-		d = (r.get("domain") or "").strip().lower()
+		get = r.get
+		d = (get("domain") or "").strip().lower()
 		if not d:
 			continue
-		groups[d].append(r)
-
-	winners: List[Dict] = []
-	for d, recs in groups.items():
-		if not recs:
-			continue
-		best = max(recs, key=completeness_score)
-		winners.append(best)
-	return winners
+		n_phones = len(get("phones") or ())
+		current = winners.get(d)
+		if current is not None and current[0] >= _MAX_FLAGS + n_phones:
+			continue  # Cannot beat the incumbent even with every flag set
+		# completeness_score inlined, reusing the phone count from above
+		score = bool(get("address")) + bool(get("facebook")) + bool(get("linkedin")) + bool(get("twitter")) + n_phones
+		if current is None or score > current[0]:
+			winners[d] = (score, r)
+	return [r for _, r in winners.values()]
 
 
 def main(argv: Optional[List[str]] = None) -> int:
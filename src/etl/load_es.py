@@ -5,9 +5,16 @@ import json
 from pathlib import Path
 import time
 import sys
-from typing import Dict, Iterable, List, Optional
+from typing import List, Optional
+
+# orjson, when installed, backs the Elasticsearch client serializer
+try:
+	import orjson
+except ImportError:  # pragma: no cover
+	orjson = None  # type: ignore
 try:
 	from src.common.console import Console
+	from src.etl.ndjson_io import read_ndjson
 except Exception:  # pragma: no cover - fallback when run as a script
 	import sys as _sys
 	from pathlib import Path as _Path
@@ -15,18 +22,7 @@ except Exception:  # pragma: no cover - fallback when run as a script
 	if str(_repo_root) not in _sys.path:
 		_sys.path.insert(0, str(_repo_root))
 	from src.common.console import Console  # type: ignore
-
-
-def read_ndjson(path: Path) -> Iterable[Dict]:
-	with path.open("r", encoding="utf-8") as f:
-		for line in f:
-			line = line.strip()
-			if not line:
-				continue
-			try:
-				yield json.loads(line)
-			except json.JSONDecodeError:
-				continue
+	from src.etl.ndjson_io import read_ndjson  # type: ignore
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -36,6 +32,8 @@ def main(argv: Optional[List[str]] = None) -> int:
 	ap.add_argument("--alias", default="companies")
 	ap.add_argument("--mappings", default="configs/es.mappings.json")
 	ap.add_argument("--es", default="http://localhost:9200")
+	ap.add_argument("--threads", type=int, default=4, help="Parallel bulk request threads")
+	ap.add_argument("--chunk-size", type=int, default=2000, help="Documents per bulk request")
 	ap.add_argument("--dry-run", action="store_true", help="Do not connect to ES, just validate input file")
 	ap.add_argument("--no-color", action="store_true", help="Disable colored output")
 	args = ap.parse_args(argv)
@@ -64,12 +62,28 @@ def main(argv: Optional[List[str]] = None) -> int:
 
 	try:
 		from elasticsearch import Elasticsearch
-		from elasticsearch.helpers import bulk
+		from elasticsearch.helpers import parallel_bulk
 	except Exception as e:
 		error("[ETL] Elasticsearch client not available. Install 'elasticsearch' to load data.")
 		return 2
 
-	es = Elasticsearch([args.es])
+	# Bulk helpers serialize every action through the client's JSON serializer
+	client_kwargs = {}
+	if orjson is not None:
+		try:
+			from elasticsearch.serializer import OrjsonSerializer
+			client_kwargs["serializer"] = OrjsonSerializer()
+		except ImportError:  # pragma: no cover - elasticsearch<8.13
+			pass
+	# One keep-alive connection per bulk thread; gzip shrinks the repetitive bulk bodies
+	es = Elasticsearch(
+		[args.es],
+		http_compress=True,
+		connections_per_node=max(10, args.threads),
+		request_timeout=60,
+		retry_on_timeout=True,
+		**client_kwargs,
+	)
 
 	# Wait briefly for ES to be ready (helps right after 'make up')
 	def _wait_for_es(client, timeout_s: int = 30) -> bool:
@@ -113,12 +127,41 @@ def main(argv: Optional[List[str]] = None) -> int:
 				"_source": r,
 			}
 
-	indexed_count, _ = bulk(es, generate_docs(), chunk_size=500)
+	# No refreshes or replica copies while loading; previous values restored afterwards
+	index_settings = es.indices.get_settings(index=args.index)[args.index]["settings"]["index"]
+	es.indices.put_settings(index=args.index, settings={"index": {"refresh_interval": "-1", "number_of_replicas": 0}})
+	indexed_count = 0
+	failed_count = 0
+	max_warnings = 10
+	try:
+		# Rejected documents come back as (False, item); transport failures still raise
+		for ok, item in parallel_bulk(
+			es,
+			generate_docs(),
+			thread_count=args.threads,
+			chunk_size=args.chunk_size,
+			queue_size=args.threads * 2,
+			raise_on_error=False,
+		):
+			if ok:
+				indexed_count += 1
+			else:
+				failed_count += 1
+				if failed_count <= max_warnings:
+					warn(f"[ETL] Warning: failed to index document: {item}")
+	finally:
+		es.indices.put_settings(index=args.index, settings={"index": {
+			"refresh_interval": index_settings.get("refresh_interval"),  # None restores the ES default
+			"number_of_replicas": index_settings.get("number_of_replicas", 1),
+		}})
+		es.indices.refresh(index=args.index)
+	if failed_count:
+		error(f"[ETL] {failed_count} records failed to index ({indexed_count} loaded); alias '{args.alias}' not updated")
+		return 4
 	es.indices.put_alias(index=args.index, name=args.alias)
 	success(f"[ETL] Loaded {indexed_count} records into index '{args.index}' and alias '{args.alias}'")
 	return 0
 
-
 if __name__ == "__main__":
 	raise SystemExit(main())
 
@@ -2,12 +2,13 @@ from __future__ import annotations
 
 import argparse
 import csv
-import json
 from pathlib import Path
 import sys
 from typing import Dict, Iterable, List, Optional
+
 try:
     from src.common.console import Console
+    from src.etl.ndjson_io import read_ndjson, write_ndjson
 except Exception:  # pragma: no cover - fallback when run as a script
     import sys as _sys
     from pathlib import Path as _Path
@@ -15,37 +16,28 @@ except Exception:  # pragma: no cover - fallback when run as a script
     if str(_repo_root) not in _sys.path:
         _sys.path.insert(0, str(_repo_root))
     from src.common.console import Console  # type: ignore
-
-
-def read_ndjson(path: Path) -> Iterable[Dict]:
-    with path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
-
-def write_ndjson(path: Path, records: Iterable[Dict]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as f:
-        for rec in records:
-            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    from src.etl.ndjson_io import read_ndjson, write_ndjson  # type: ignore
 
 
 def read_names_csv(csv_path: Path) -> Dict[str, str]:
     mapping: Dict[str, str] = {}
     with csv_path.open("r", encoding="utf-8-sig", newline="") as f:
-        reader = csv.DictReader(f)
-        # Expect at least: domain, company_name
+        reader = csv.reader(f)
+        # Expect at least: domain, company_name (resolved to column indices once)
+        # Header names match exactly and the last duplicate wins, as with csv.DictReader
+        idx = {h: i for i, h in enumerate(next(reader, []))}
+        if "domain" not in idx or "company_name" not in idx:
+            return mapping
+        i_dom = idx["domain"]
+        i_name = idx["company_name"]
+        min_len = max(i_dom, i_name) + 1
         for row in reader:
-            d = (row.get("domain") or "").strip().lower()
-            name = (row.get("company_name") or "").strip()
+            if len(row) < min_len:
+                continue
+            d = row[i_dom].strip().lower()
+            name = row[i_name].strip()
             if d and name:
-                mapping[d] = name
+                mapping[sys.intern(d)] = name
     return mapping
 
 
@@ -56,8 +48,9 @@ def merge(records: Iterable[Dict], names_map: Dict[str, str]) -> Iterable[Dict]:
             yield r
             continue
         out = dict(r)
-        if d in names_map:
-            out["company_name"] = names_map[d]
+        name = names_map.get(d)  # one probe instead of `in` + subscript
+        if name is not None:
+            out["company_name"] = name
         else:
             out.setdefault("company_name", None)
         yield out
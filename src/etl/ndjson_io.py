@@ -0,0 +1,111 @@
+"""
+NDJSON reading and writing shared by the ETL steps.
+
+Input is read through an mmap and decoded with orjson when available;
+output is encoded in batches, optionally on a background writer thread
+(PHIDI_WRITER_THREAD=1).
+"""
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from pathlib import Path
+import queue
+import threading
+from typing import Dict, Iterable, Iterator, List
+
+# orjson parses/serializes bytes in C; stdlib json is the fallback
+try:
+	import orjson
+except ImportError:  # pragma: no cover
+	orjson = None  # type: ignore
+
+
+def _lines(f) -> Iterator[bytes]:
+	"""Lines of f sliced from an mmap (no read-buffer copy); plain iteration if unmappable."""
+	try:
+		mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+	except (OSError, ValueError):  # Empty file, pipe or special file
+		yield from f
+		return
+	with mm:
+		find = mm.find
+		start = 0
+		while (nl := find(b"\n", start)) >= 0:
+			yield mm[start:nl]
+			start = nl + 1
+		if start < len(mm):
+			yield mm[start:]
+
+
+def read_ndjson(path: Path) -> Iterable[Dict]:
+	loads = orjson.loads if orjson is not None else json.loads
+	with path.open("rb") as f:
+		for line in _lines(f):
+			line = line.strip()
+			if not line:
+				continue
+			try:
+				yield loads(line)
+			except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
+				continue
+
+
+def _dumps(rec: Dict) -> bytes:
+	if orjson is not None:
+		return orjson.dumps(rec)
+	return json.dumps(rec, ensure_ascii=False).encode("utf-8")
+
+
+# Records joined per write() call; the 1 MiB file buffer absorbs the rest
+_WRITE_BATCH = 4096
+
+
+def _encoded_batches(records: Iterable[Dict]) -> Iterator[bytes]:
+	buf: List[bytes] = []
+	for rec in records:
+		buf.append(_dumps(rec))
+		if len(buf) >= _WRITE_BATCH:
+			yield b"\n".join(buf) + b"\n"
+			buf.clear()
+	if buf:
+		yield b"\n".join(buf) + b"\n"
+
+
+def _write_in_background(f, batches: Iterable[bytes]) -> None:
+	"""Encode on the caller's thread while a writer thread drains batches to disk."""
+	q: queue.Queue = queue.Queue(maxsize=4)
+	errors: List[BaseException] = []
+
+	def _drain() -> None:
+		while (batch := q.get()) is not None:
+			if not errors:
+				try:
+					f.write(batch)
+				except BaseException as e:  # surfaced on the caller's thread
+					errors.append(e)
+
+	writer = threading.Thread(target=_drain, daemon=True)
+	writer.start()
+	try:
+		for batch in batches:
+			if errors:
+				break
+			q.put(batch)
+	finally:
+		q.put(None)
+		writer.join()
+	if errors:
+		raise errors[0]
+
+
+def write_ndjson(path: Path, records: Iterable[Dict]) -> None:
+	path.parent.mkdir(parents=True, exist_ok=True)
+	with path.open("wb", buffering=1 << 20) as f:
+		# Opt-in: overlap JSON encoding with write() syscalls (which release the GIL)
+		if os.environ.get("PHIDI_WRITER_THREAD") == "1":
+			_write_in_background(f, _encoded_batches(records))
+		else:
+			for batch in _encoded_batches(records):
+				f.write(batch)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import argparse
-import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import os
 from pathlib import Path
 import sys
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 try:
 	from src.common.domain_utils import clean_domain
@@ -16,6 +18,7 @@ try:
 		canonicalize_twitter,
 	)
 	from src.common.normalize_utils import normalize_address
+	from src.etl.ndjson_io import read_ndjson, write_ndjson
 except Exception:  # pragma: no cover
 	import sys as _sys
 	from pathlib import Path as _Path
@@ -31,38 +34,27 @@ except Exception:  # pragma: no cover
 		canonicalize_twitter,
 	)
 	from src.common.normalize_utils import normalize_address  # type: ignore
+	from src.etl.ndjson_io import read_ndjson, write_ndjson  # type: ignore
 from src.common.console import Console
 
 
+# ASCII non-alphanumerics -> space, applied in C by str.translate
+_NAME_TRANS = {i: " " for i in range(128) if not chr(i).isalnum()}
+
+
 def _derive_company_name(domain: Optional[str]) -> Optional[str]:
 	if not domain:
 		return None
 	left = (domain or "").split(".")[0]
 	# Replace non-alphanumeric with space, title-case tokens
-	tokens = [t for t in "".join(ch if ch.isalnum() else " " for ch in left).strip().split() if t]
-	name = " ".join(t[:1].upper() + t[1:] for t in tokens)
+	if left.isascii():
+		cleaned = left.translate(_NAME_TRANS)
+	else:  # IDN labels: Unicode-aware isalnum()
+		cleaned = "".join(ch if ch.isalnum() else " " for ch in left)
+	name = " ".join(t[:1].upper() + t[1:] for t in cleaned.split())
 	return name or None
 
 
-def read_ndjson(path: Path) -> Iterable[Dict]:
-	with path.open("r", encoding="utf-8") as f:
-		for line in f:
-			line = line.strip()
-			if not line:
-				continue
-			try:
-				yield json.loads(line)
-			except json.JSONDecodeError:
-				continue
-
-
-def write_ndjson(path: Path, records: Iterable[Dict]) -> None:
-	path.parent.mkdir(parents=True, exist_ok=True)
-	with path.open("w", encoding="utf-8") as f:
-		for rec in records:
-			f.write(json.dumps(rec, ensure_ascii=False) + "\n")
-
-
 def normalize_record(r: Dict) -> Dict:
 	domain = clean_domain(r.get("domain"))
 	phones_raw = r.get("phones") or []
@@ -87,10 +79,53 @@ def normalize_record(r: Dict) -> Dict:
 	}
 
 
+# Records per worker task: large enough to amortize pickling/IPC per record
+_NORMALIZE_CHUNK = 256
+
+
+def _normalize_chunk(chunk: List[Dict]) -> List[Dict]:
+	return [normalize_record(r) for r in chunk]
+
+
+def _chunked(records: Iterable[Dict], size: int) -> Iterator[List[Dict]]:
+	chunk: List[Dict] = []
+	for r in records:
+		chunk.append(r)
+		if len(chunk) >= size:
+			yield chunk
+			chunk = []
+	if chunk:
+		yield chunk
+
+
+def normalize_records(records: Iterable[Dict], workers: Optional[int] = 1) -> Iterator[Dict]:
+	"""
+	Normalize records in input order, optionally across worker processes.
+
+	workers=1 (the default) normalizes in-process; the pool only pays off on
+	large inputs. workers=0 or None uses one process per CPU. Only a few
+	chunks per worker are in flight, so input is still streamed.
+	"""
+	workers = workers if workers else (os.cpu_count() or 1)
+	if workers <= 1:
+		yield from (normalize_record(r) for r in records)
+		return
+
+	with ProcessPoolExecutor(max_workers=workers) as ex:
+		pending = deque()
+		for chunk in _chunked(records, _NORMALIZE_CHUNK):
+			pending.append(ex.submit(_normalize_chunk, chunk))
+			if len(pending) >= workers * 4:
+				yield from pending.popleft().result()
+		while pending:
+			yield from pending.popleft().result()
+
+
 def main(argv: Optional[List[str]] = None) -> int:
 	ap = argparse.ArgumentParser(description="ETL Step 1: Normalize crawl results")
 	ap.add_argument("--input", default="data/staging/crawl_results.ndjson")
 	ap.add_argument("--output", default="data/staging/crawl_results_normalized.ndjson")
+	ap.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1 = in-process; 0 = CPU count)")
 	ap.add_argument("--no-color", action="store_true", help="Disable colored output")
 	args = ap.parse_args(argv)
 
@@ -112,7 +147,7 @@ def main(argv: Optional[List[str]] = None) -> int:
 		info("  - Provide a custom input via '--input <path-to-ndjson>'.")
 		return 2
 
-	write_ndjson(out, (normalize_record(r) for r in read_ndjson(inp)))
+	write_ndjson(out, normalize_records(read_ndjson(inp), workers=args.workers))
 	success(f"[ETL] Wrote normalized records: {out}")
 	return 0
 
@@ -23,18 +23,30 @@ Notes
 - Success is defined as http_status in [200..399].
 - Fill rates are computed over successful crawls only.
 - If a domain has no record in results, it is considered a failure (other).
+- Results are streamed one line at a time (iter_ndjson) and only the best
+  record per input domain is kept, so memory is bounded by the input list
+  rather than the size of the results file.
 """
 
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 import csv
 import json
 import math
-from dataclasses import dataclass
+import mmap
+import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from statistics import mean, median
-from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+from statistics import fmean
+from typing import TYPE_CHECKING, AbstractSet, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# orjson parses bytes in C; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 if TYPE_CHECKING:
     from src.eval.format_adapters import CrawlerFormatAdapter
@@ -43,21 +55,35 @@ SUCCESS_MIN = 200
 SUCCESS_MAX = 399
 
 
-@dataclass
+@dataclass(slots=True)
 class CrawlRecord:
     domain: str
     http_status: Optional[int]
     response_time_ms: Optional[float]
     phones: List[str]
-    social: Dict[str, Optional[str]]
+    facebook_url: Optional[str]
+    linkedin_url: Optional[str]
+    twitter_url: Optional[str]
+    instagram_url: Optional[str]
     address: Optional[str]
     error: Optional[str]
+    # Derived once at construction; grouping and failure bucketing read them per record
+    is_success: bool = field(init=False)
+    failure_bucket: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        status = self.http_status
+        self.is_success = status is not None and SUCCESS_MIN <= status <= SUCCESS_MAX
+        self.failure_bucket = classify_failure(self)
 
     @property
-    def is_success(self) -> bool:
-        if self.http_status is None:
-            return False
-        return SUCCESS_MIN <= int(self.http_status) <= SUCCESS_MAX
+    def social(self) -> Dict[str, Optional[str]]:
+        return {
+            "facebook_url": self.facebook_url,
+            "linkedin_url": self.linkedin_url,
+            "twitter_url": self.twitter_url,
+            "instagram_url": self.instagram_url,
+        }
 
     @property
     def has_phone(self) -> bool:
@@ -65,13 +91,10 @@ class CrawlRecord:
 
     @property
     def has_any_social(self) -> bool:
-        return any(
-            bool(self.social.get(k))
-            for k in ("facebook_url", "linkedin_url", "twitter_url", "instagram_url")
-        )
+        return bool(self.facebook_url or self.linkedin_url or self.twitter_url or self.instagram_url)
 
     def has_platform(self, platform: str) -> bool:
-        return bool(self.social.get(platform))
+        return bool(getattr(self, platform, None))
 
     @property
     def has_address(self) -> bool:
@@ -86,136 +109,282 @@ def read_input_domains(csv_path: Path) -> List[str]:
         return [row["domain"].strip() for row in reader if row.get("domain")] 
 
 
-def parse_ndjson(file_path: Path, adapter: Optional[CrawlerFormatAdapter] = None) -> List[CrawlRecord]:
+# Results files smaller than this are parsed in-process even when workers > 1
+_PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+
+# Compared by length first, so the check is nearly free for real records
+_BLANK_LINES = (b"\n", b"\r\n", b"", b"\r")
+
+
+def _iter_records(lines: Iterable[bytes], adapter: CrawlerFormatAdapter) -> Iterator[CrawlRecord]:
+    loads = orjson.loads if orjson is not None else json.loads
+    intern = sys.intern
+    # One extract call per line rather than one adapter call per field
+    get_domain = adapter.get_domain
+    extract = adapter.extract_record
+    # Both decoders skip surrounding whitespace, so lines go in unstripped.
+    # Bare line breaks are skipped up front instead of via a decode error.
+    for line in lines:
+        if line in _BLANK_LINES:
+            continue
+        try:
+            obj = loads(line)
+        except ValueError:  # json.JSONDecodeError / orjson.JSONDecodeError
+            continue
+        fields = extract(obj)
+        # Retries repeat domains and errors ("timeout", ...): share one string each
+        domain = get_domain(obj)
+        error = fields["error"]
+        yield CrawlRecord(
+            domain=intern(domain) if domain else domain,
+            http_status=_safe_int(fields["http_status"]),
+            response_time_ms=_safe_float(fields["response_time_ms"]),
+            phones=fields["phones"],
+            facebook_url=fields["facebook_url"],
+            linkedin_url=fields["linkedin_url"],
+            twitter_url=fields["twitter_url"],
+            instagram_url=fields["instagram_url"],
+            address=fields["address"],
+            error=intern(error) if isinstance(error, str) else error,
+        )
+
+
+def _parse_range(file_path: Path, start: int, end: int, adapter: CrawlerFormatAdapter) -> List[CrawlRecord]:
+    """Worker task: parse the whole lines in file_path[start:end]."""
+    with file_path.open("rb") as f:
+        f.seek(start)
+        return list(_iter_records(f.read(end - start).split(b"\n"), adapter))
+
+
+def _line_aligned_ranges(file_path: Path, parts: int) -> List[Tuple[int, int]]:
+    """Split the file into up to `parts` byte ranges that each end after a newline."""
+    with file_path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        bounds = [0]
+        for i in range(1, parts):
+            nl = mm.find(b"\n", max(i * size // parts, bounds[-1]))
+            if nl < 0:
+                break
+            if nl + 1 < size:
+                bounds.append(nl + 1)
+        bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+
+def iter_ndjson(file_path: Path, adapter: Optional[CrawlerFormatAdapter] = None) -> Iterator[CrawlRecord]:
+    """
+    Stream CrawlRecords from an NDJSON file, one line at a time.
+    
+    Use this when the records are consumed once (e.g. grouped by domain), so
+    the full list never has to be held in memory. Missing files yield nothing.
+    """
+    # Import here to avoid circular dependency
+    if adapter is None:
+        from src.eval.format_adapters import get_default_adapter
+        adapter = get_default_adapter()
+    
+    if not file_path.exists():
+        return
+    with file_path.open("rb") as f:
+        yield from _iter_records(f, adapter)
+
+
+def parse_ndjson(
+    file_path: Path,
+    adapter: Optional[CrawlerFormatAdapter] = None,
+    workers: int = 1,
+) -> List[CrawlRecord]:
     """
     Parse NDJSON file using the specified format adapter.
     
     Args:
         file_path: Path to NDJSON file
         adapter: Format adapter to use. If None, uses AutoDetectAdapter.
+        workers: Worker processes for large files; each parses a line-aligned
+            byte range and results are concatenated in file order.
     
     Returns:
         List of CrawlRecord objects
     """
-    # Import here to avoid circular dependency
-    if adapter is None:
-        from src.eval.format_adapters import AutoDetectAdapter
-        adapter = AutoDetectAdapter()
-    
-    records: List[CrawlRecord] = []
-    if not file_path.exists():
+    if workers > 1 and file_path.exists() and file_path.stat().st_size >= _PARALLEL_MIN_BYTES:
+        # Import here to avoid circular dependency
+        if adapter is None:
+            from src.eval.format_adapters import get_default_adapter
+            adapter = get_default_adapter()
+        ranges = _line_aligned_ranges(file_path, workers)
+        with ProcessPoolExecutor(max_workers=len(ranges)) as ex:
+            futures = [ex.submit(_parse_range, file_path, a, b, adapter) for a, b in ranges]
+            records: List[CrawlRecord] = []
+            for fut in futures:
+                records.extend(fut.result())
         return records
-    with file_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            records.append(
-                CrawlRecord(
-                    domain=adapter.get_domain(obj),
-                    http_status=_safe_int(adapter.get_http_status(obj)),
-                    response_time_ms=_safe_float(adapter.get_response_time_ms(obj)),
-                    phones=adapter.get_phones(obj),
-                    social=adapter.get_social_urls(obj),
-                    address=adapter.get_address(obj),
-                    error=adapter.get_error(obj),
-                )
-            )
-    return records
-
-
-def group_best_record_by_domain(records: Iterable[CrawlRecord]) -> Dict[str, CrawlRecord]:
+    return list(iter_ndjson(file_path, adapter))
+
+
+def group_best_record_by_domain(
+    records: Iterable[CrawlRecord],
+    domains: Optional[AbstractSet[str]] = None,
+) -> Dict[str, CrawlRecord]:
     """Return one record per domain.
     Strategy: prefer a successful record; otherwise keep the first seen.
+    When `domains` is given, records for other domains are skipped.
     """
     by_domain: Dict[str, CrawlRecord] = {}
     for r in records:
-        if not r.domain:
+        d = r.domain
+        if not d or (domains is not None and d not in domains):
             continue
-        existing = by_domain.get(r.domain)
+        existing = by_domain.get(d)
         if existing is None:
-            by_domain[r.domain] = r
-        else:
-            if not existing.is_success and r.is_success:
-                by_domain[r.domain] = r
+            by_domain[d] = r
+        elif not existing.is_success and r.is_success:
+            by_domain[d] = r
     return by_domain
 
 
-def quantile(values: List[float], q: float) -> float:
+def quantile(values: List[float], q: float, presorted: bool = False) -> float:
     if not values:
         return math.nan
     if q <= 0:
-        return min(values)
+        return values[0] if presorted else min(values)
     if q >= 1:
-        return max(values)
-    vs = sorted(values)
+        return values[-1] if presorted else max(values)
+    vs = values if presorted else sorted(values)
     idx = int(round(q * (len(vs) - 1)))
     idx = max(0, min(idx, len(vs) - 1))
     return float(vs[idx])
 
 
+def _median_sorted(vs: List[float]) -> float:
+    """statistics.median() for an already sorted list (it would sort again)."""
+    mid = len(vs) // 2
+    if len(vs) % 2:
+        return vs[mid]
+    return (vs[mid - 1] + vs[mid]) / 2
+
+
 def classify_failure(rec: Optional[CrawlRecord]) -> str:
+    """Failure bucket for a domain's record (None when the domain has no record)."""
     if rec is None:
         return "other"
     status = rec.http_status
-    if status is None:
-        if rec.error and "timeout" in str(rec.error).lower():
-            return "timeout"
-        if rec.error and "ssl" in str(rec.error).lower():
-            return "ssl"
-        return "other"
-    if status == 404:
-        return "404"
-    if 500 <= status <= 599:
-        return "5xx"
-    if rec.error and "timeout" in str(rec.error).lower():
+    if status is not None:
+        if status == 404:
+            return "404"
+        if 500 <= status <= 599:
+            return "5xx"
+    # Error text is lowercased once and checked for both markers
+    error = str(rec.error).lower() if rec.error else ""
+    if "timeout" in error:
         return "timeout"
-    if rec.error and "ssl" in str(rec.error).lower():
+    if "ssl" in error:
         return "ssl"
     return "other"
 
 
-def compute_metrics_for_dataset(name: str, input_domains: List[str], records: List[CrawlRecord]) -> Dict[str, float]:
-    by_domain = group_best_record_by_domain(records)
+@dataclass(slots=True)
+class FillCounts:
+    """Column totals over successful records, gathered by count_fills()."""
+    phone: int = 0
+    social: int = 0
+    address: int = 0
+    facebook: int = 0
+    linkedin: int = 0
+    twitter: int = 0
+    instagram: int = 0
+    datapoints: int = 0  # phones + social links + address present
+    latencies: List[float] = field(default_factory=list)
+
+
+def count_fills(records: Iterable[CrawlRecord]) -> FillCounts:
+    """Count every fill-rate column and collect latencies in a single pass."""
+    cnt_phone = cnt_social = cnt_addr = cnt_fb = cnt_li = cnt_tw = cnt_ig = datapoints = 0
+    lats: List[float] = []
+    for r in records:
+        n_phones = len(r.phones)
+        if n_phones:
+            cnt_phone += 1
+        fb = r.facebook_url
+        li = r.linkedin_url
+        tw = r.twitter_url
+        ig = r.instagram_url
+        if fb:
+            cnt_fb += 1
+        if li:
+            cnt_li += 1
+        if tw:
+            cnt_tw += 1
+        if ig:
+            cnt_ig += 1
+        socials = bool(fb) + bool(li) + bool(tw) + bool(ig)
+        if socials:
+            cnt_social += 1
+        has_addr = bool(r.address and str(r.address).strip())
+        if has_addr:
+            cnt_addr += 1
+        datapoints += n_phones + socials + has_addr
+        rt = r.response_time_ms  # Already a float from _safe_float
+        if rt is not None:
+            lats.append(rt)
+    return FillCounts(cnt_phone, cnt_social, cnt_addr, cnt_fb, cnt_li, cnt_tw, cnt_ig, datapoints, lats)
+
+
+# Failure buckets in report order; each dataset copies this zeroed template
+_FAILURE_BUCKETS = dict.fromkeys(("timeout", "404", "5xx", "ssl", "other"), 0)
+
+
+def compute_metrics_for_dataset(
+    name: str,
+    input_domains: List[str],
+    records: Iterable[CrawlRecord],
+    *,
+    input_set: Optional[AbstractSet[str]] = None,
+) -> Dict[str, float]:
+    """
+    Coverage, fill-rate, latency and failure metrics for one crawler's records.
+
+    When comparing several crawlers on the same inputs, pass
+    input_set=set(input_domains) built once instead of per dataset.
+    """
+    if input_set is None:
+        input_set = set(input_domains)
+    # Records for domains outside the input list can never be counted
+    by_domain = group_best_record_by_domain(records, input_set)
 
     total = len(input_domains)
-    success_domains: List[str] = []
     success_records: List[CrawlRecord] = []
-    failures: Dict[str, int] = {"timeout": 0, "404": 0, "5xx": 0, "ssl": 0, "other": 0}
+    failures: Dict[str, int] = _FAILURE_BUCKETS.copy()
 
     for d in input_domains:
         rec = by_domain.get(d)
         if rec and rec.is_success:
-            success_domains.append(d)
             success_records.append(rec)
         else:
-            failures[classify_failure(rec)] += 1
+            failures[rec.failure_bucket if rec is not None else classify_failure(None)] += 1
 
-    successes = len(success_domains)
+    successes = len(success_records)
     coverage = (successes / total) * 100 if total > 0 else 0.0
 
-    # Fill rates over successful records
-    def fr(predicate) -> float:
-        if successes == 0:
-            return 0.0
-        return (sum(1 for r in success_records if predicate(r)) / successes) * 100.0
-
-    phone_fill = fr(lambda r: r.has_phone)
-    social_fill = fr(lambda r: r.has_any_social)
-    address_fill = fr(lambda r: r.has_address)
-    fb_fill = fr(lambda r: r.has_platform("facebook_url"))
-    li_fill = fr(lambda r: r.has_platform("linkedin_url"))
-    tw_fill = fr(lambda r: r.has_platform("twitter_url"))
-    ig_fill = fr(lambda r: r.has_platform("instagram_url"))
-
-    lats = [float(r.response_time_ms) for r in success_records if r.response_time_ms is not None]
-    avg_lat = mean(lats) if lats else float("nan")
-    p50_lat = median(lats) if lats else float("nan")
-    p95_lat = quantile(lats, 0.95) if lats else float("nan")
+    # Fill rates over successful records, counted in a single pass
+    counts = count_fills(success_records)
+    lats = counts.latencies
+
+    def pct(count: int) -> float:
+        return (count / successes) * 100.0 if successes else 0.0
+
+    phone_fill = pct(counts.phone)
+    social_fill = pct(counts.social)
+    address_fill = pct(counts.address)
+    fb_fill = pct(counts.facebook)
+    li_fill = pct(counts.linkedin)
+    tw_fill = pct(counts.twitter)
+    ig_fill = pct(counts.instagram)
+
+    lats.sort()  # One sort shared by p50 and p95
+    avg_lat = fmean(lats) if lats else float("nan")
+    p50_lat = _median_sorted(lats) if lats else float("nan")
+    p95_lat = quantile(lats, 0.95, presorted=True) if lats else float("nan")
 
     return {
         "crawler": name,
@@ -240,93 +409,82 @@ def compute_metrics_for_dataset(name: str, input_domains: List[str], records: Li
     }
 
 
+CSV_FIELDNAMES = (
+    "crawler",
+    "total_sites",
+    "successes",
+    "coverage_pct",
+    "phone_fill_pct",
+    "social_fill_pct",
+    "address_fill_pct",
+    "facebook_fill_pct",
+    "linkedin_fill_pct",
+    "twitter_fill_pct",
+    "instagram_fill_pct",
+    "avg_latency_ms",
+    "p50_latency_ms",
+    "p95_latency_ms",
+    "fail_timeout",
+    "fail_404",
+    "fail_5xx",
+    "fail_ssl",
+    "fail_other",
+)
+
+
 def write_csv(rows: List[Dict[str, float]], csv_path: Path) -> None:
     csv_path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = [
-        "crawler",
-        "total_sites",
-        "successes",
-        "coverage_pct",
-        "phone_fill_pct",
-        "social_fill_pct",
-        "address_fill_pct",
-        "facebook_fill_pct",
-        "linkedin_fill_pct",
-        "twitter_fill_pct",
-        "instagram_fill_pct",
-        "avg_latency_ms",
-        "p50_latency_ms",
-        "p95_latency_ms",
-        "fail_timeout",
-        "fail_404",
-        "fail_5xx",
-        "fail_ssl",
-        "fail_other",
-    ]
     with csv_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
+        writer = csv.writer(f)
+        writer.writerow(CSV_FIELDNAMES)
+        # Missing keys become empty cells, as DictWriter's restval did
+        writer.writerows([row.get(k, "") for k in CSV_FIELDNAMES] for row in rows)
 
 
-def write_markdown(rows: List[Dict[str, float]], md_path: Path) -> None:
-    md_path.parent.mkdir(parents=True, exist_ok=True)
-    header = (
-        "| Metric | "
-        + " | ".join(row["crawler"] for row in rows)
-        + " |\n|---|" + "|".join(["---"] * len(rows)) + "|\n"
-    )
+def _fmt_pct(x) -> str:
+    return f"{x:.1f}" if isinstance(x, (int, float)) and not math.isnan(float(x)) else "-"
+
+
+def _fmt_ms(x) -> str:
+    return f"{x:.0f}" if isinstance(x, (int, float)) and not math.isnan(float(x)) else "-"
 
-    def line(metric: str, fmt=lambda x: x):
-        return "| {m} | ".format(m=metric) + " | ".join(
-            fmt(row.get(metric_key(metric), float("nan"))) for row in rows
-        ) + " |\n"
-
-    def metric_key(metric_name: str) -> str:
-        mapping = {
-            "Coverage (%)": "coverage_pct",
-            "Phone fill (%)": "phone_fill_pct",
-            "Social fill (%)": "social_fill_pct",
-            "Address fill (%)": "address_fill_pct",
-            "Facebook fill (%)": "facebook_fill_pct",
-            "LinkedIn fill (%)": "linkedin_fill_pct",
-            "Twitter fill (%)": "twitter_fill_pct",
-            "Instagram fill (%)": "instagram_fill_pct",
-            "Avg latency (ms)": "avg_latency_ms",
-            "p50 latency (ms)": "p50_latency_ms",
-            "p95 latency (ms)": "p95_latency_ms",
-        }
-        return mapping[metric_name]
 
-    def fmt_pct(x):
-        return f"{x:.1f}" if isinstance(x, (int, float)) and not math.isnan(float(x)) else "-"
+# (row label, metrics key, formatter) for each line of the Markdown table
+_MD_METRICS = (
+    ("Coverage (%)", "coverage_pct", _fmt_pct),
+    ("Phone fill (%)", "phone_fill_pct", _fmt_pct),
+    ("Social fill (%)", "social_fill_pct", _fmt_pct),
+    ("Address fill (%)", "address_fill_pct", _fmt_pct),
+    ("Facebook fill (%)", "facebook_fill_pct", _fmt_pct),
+    ("LinkedIn fill (%)", "linkedin_fill_pct", _fmt_pct),
+    ("Twitter fill (%)", "twitter_fill_pct", _fmt_pct),
+    ("Instagram fill (%)", "instagram_fill_pct", _fmt_pct),
+    ("Avg latency (ms)", "avg_latency_ms", _fmt_ms),
+    ("p50 latency (ms)", "p50_latency_ms", _fmt_ms),
+    ("p95 latency (ms)", "p95_latency_ms", _fmt_ms),
+)
 
-    def fmt_ms(x):
-        return f"{x:.0f}" if isinstance(x, (int, float)) and not math.isnan(float(x)) else "-"
 
+def write_markdown(rows: List[Dict[str, float]], md_path: Path) -> None:
+    md_path.parent.mkdir(parents=True, exist_ok=True)
+    nan = float("nan")
     lines = [
         "# Crawler comparison\n\n",
-        header,
-        line("Coverage (%)", fmt_pct),
-        line("Phone fill (%)", fmt_pct),
-        line("Social fill (%)", fmt_pct),
-        line("Address fill (%)", fmt_pct),
-        line("Facebook fill (%)", fmt_pct),
-        line("LinkedIn fill (%)", fmt_pct),
-        line("Twitter fill (%)", fmt_pct),
-        line("Instagram fill (%)", fmt_pct),
-        line("Avg latency (ms)", fmt_ms),
-        line("p50 latency (ms)", fmt_ms),
-        line("p95 latency (ms)", fmt_ms),
-        "\n",
-        "Notes: coverage and fill rates are computed over successful crawls (HTTP 2xx-3xx).\n",
+        "| Metric | " + " | ".join(row["crawler"] for row in rows) + " |\n",
+        "|---|" + "|".join(["---"] * len(rows)) + "|\n",
     ]
-    with md_path.open("w", encoding="utf-8") as f:
-        f.writelines(lines)
+    for label, key, fmt in _MD_METRICS:
+        lines.append(f"| {label} | " + " | ".join(fmt(row.get(key, nan)) for row in rows) + " |\n")
+    lines.append("\n")
+    lines.append("Notes: coverage and fill rates are computed over successful crawls (HTTP 2xx-3xx).\n")
+    md_path.write_text("".join(lines), encoding="utf-8")
 
 
 def _safe_int(v) -> Optional[int]:
+    if type(v) is int:  # Common JSON case: no conversion or exception setup
+        return v
+    if v is None:
+        return None
     try:
         return int(v)
     except (TypeError, ValueError):
@@ -334,6 +492,13 @@ def _safe_int(v) -> Optional[int]:
 
 
 def _safe_float(v) -> Optional[float]:
+    t = type(v)
+    if t is float:
+        return v
+    if t is int:
+        return float(v)
+    if v is None:
+        return None
     try:
         return float(v)
     except (TypeError, ValueError):
@@ -364,16 +529,23 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
     ap.add_argument("--csv-out", default="data/reports/metrics.csv", help="Output CSV path")
     ap.add_argument("--md-out", default="data/reports/summary.md", help="Output Markdown path")
+    ap.add_argument("--workers", type=int, default=1, help="Processes for parsing large results files")
 
     args = ap.parse_args(argv)
 
     input_domains = read_input_domains(Path(args.input))
     datasets = parse_results_args(list(args.results))
 
+    input_set = set(input_domains)  # Shared by every dataset below
+
     rows: List[Dict[str, float]] = []
     for name, path in datasets:
-        records = parse_ndjson(Path(path))
-        metrics = compute_metrics_for_dataset(name, input_domains, records)
+        # Records are only grouped once, so stream them unless parsing in parallel
+        if args.workers > 1:
+            records = parse_ndjson(Path(path), workers=args.workers)
+        else:
+            records = iter_ndjson(Path(path))
+        metrics = compute_metrics_for_dataset(name, input_domains, records, input_set=input_set)
         rows.append(metrics)
 
     # Write artifacts
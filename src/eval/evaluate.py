@@ -18,19 +18,28 @@ Usage:
 from __future__ import annotations
 
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 import csv
+import json
 import math
 from dataclasses import dataclass
 from pathlib import Path
-from statistics import mean
-from typing import Dict, Iterable, List, Optional, Tuple
+from statistics import fmean
+from typing import AbstractSet, Dict, Iterable, List, Optional, Tuple
+
+# orjson parses bytes in C; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 # Reuse parsing utilities from compute_metrics to keep things DRY
 try:
     # When run as a module
     from .compute_metrics import (
         CrawlRecord,
-        parse_ndjson,
+        count_fills,
+        iter_ndjson,
         read_input_domains,
         group_best_record_by_domain,
     )
@@ -42,7 +51,8 @@ except Exception:  # pragma: no cover - fallback for script execution
         sys.path.insert(0, str(repo_root))
     from src.eval.compute_metrics import (  # type: ignore
         CrawlRecord,
-        parse_ndjson,
+        count_fills,
+        iter_ndjson,
         read_input_domains,
         group_best_record_by_domain,
     )
@@ -63,8 +73,17 @@ class EvalRow:
     avg_datapoints_per_site: float
 
 
-def compute_eval_for_dataset(name: str, input_domains: List[str], records: List[CrawlRecord], results_path: Optional[Path] = None) -> EvalRow:
-    by_domain = group_best_record_by_domain(records)
+def compute_eval_for_dataset(
+    name: str,
+    input_domains: List[str],
+    records: Iterable[CrawlRecord],
+    results_path: Optional[Path] = None,
+    *,
+    input_set: Optional[AbstractSet[str]] = None,
+) -> EvalRow:
+    if input_set is None:
+        input_set = set(input_domains)
+    by_domain = group_best_record_by_domain(records, input_set)
     total = len(input_domains)
     success_records: List[CrawlRecord] = []
 
@@ -76,41 +95,33 @@ def compute_eval_for_dataset(name: str, input_domains: List[str], records: List[
     successes = len(success_records)
     coverage = (successes / total) if total > 0 else 0.0
 
-    # Fill rates over success_records
-    def fr(predicate) -> float:
-        if successes == 0:
-            return 0.0
-        return (sum(1 for r in success_records if predicate(r)) / successes)
+    # Fill rates, latencies and datapoints over success_records in one pass
+    counts = count_fills(success_records)
+
+    def fr(count: int) -> float:
+        return (count / successes) if successes else 0.0
 
     # Avg response time over success_records
-    lats = [float(r.response_time_ms) for r in success_records if r.response_time_ms is not None]
-    avg_response_time_ms = mean(lats) if lats else float("nan")
+    lats = counts.latencies
+    avg_response_time_ms = fmean(lats) if lats else float("nan")
 
     # Read total_time_seconds from meta.json if available
     total_time_seconds = float("nan")
     if results_path:
         meta_path = results_path.with_suffix(".meta.json")
-        if meta_path.exists():
-            try:
-                import json
-                with meta_path.open("r", encoding="utf-8") as f:
-                    meta = json.load(f)
-                    total_time_seconds = float(meta.get("total_time_seconds", float("nan")))
-            except Exception:
-                pass  # If meta file is missing or malformed, use NaN
-
-    phone_fill = fr(lambda r: r.has_phone)
-    social_fill = fr(lambda r: r.has_any_social)
-    address_fill = fr(lambda r: r.has_address)
+        try:
+            loads = orjson.loads if orjson is not None else json.loads
+            meta = loads(meta_path.read_bytes())
+            total_time_seconds = float(meta.get("total_time_seconds", float("nan")))
+        except Exception:
+            pass  # If meta file is missing or malformed, use NaN
 
-    # Datapoints per successful site: phones count + social links present + address present(1/0)
-    def datapoints_for(r: CrawlRecord) -> int:
-        socials = sum(
-            1 for k in ("facebook_url", "linkedin_url", "twitter_url", "instagram_url") if r.social.get(k)
-        )
-        return len(r.phones) + socials + (1 if r.has_address else 0)
+    phone_fill = fr(counts.phone)
+    social_fill = fr(counts.social)
+    address_fill = fr(counts.address)
 
-    total_datapoints = sum(datapoints_for(r) for r in success_records)
+    # Datapoints per successful site: phones count + social links present + address present(1/0)
+    total_datapoints = counts.datapoints
     avg_dps = (total_datapoints / successes) if successes > 0 else 0.0
 
     return EvalRow(
@@ -128,62 +139,69 @@ def compute_eval_for_dataset(name: str, input_domains: List[str], records: List[
     )
 
 
+CSV_FIELDNAMES = (
+    "crawler",
+    "coverage",
+    "avg_response_time_ms",
+    "total_time_seconds",
+    "phone_fill_rate",
+    "social_fill_rate",
+    "address_fill_rate",
+    "total_datapoints",
+)
+
+
 def write_csv(rows: List[EvalRow], csv_path: Path) -> None:
     csv_path.parent.mkdir(parents=True, exist_ok=True)
-    fieldnames = [
-        "crawler",
-        "coverage",
-        "avg_response_time_ms",
-        "total_time_seconds",
-        "phone_fill_rate",
-        "social_fill_rate",
-        "address_fill_rate",
-        "total_datapoints",
-    ]
     with csv_path.open("w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow(
-                {
-                    "crawler": r.crawler,
-                    "coverage": round(r.coverage, 3),
-                    "avg_response_time_ms": round(r.avg_response_time_ms) if not math.isnan(r.avg_response_time_ms) else "",
-                    "total_time_seconds": round(r.total_time_seconds) if not math.isnan(r.total_time_seconds) else "",
-                    "phone_fill_rate": round(r.phone_fill_rate, 3),
-                    "social_fill_rate": round(r.social_fill_rate, 3),
-                    "address_fill_rate": round(r.address_fill_rate, 3),
-                    "total_datapoints": r.total_datapoints,
-                }
+        w = csv.writer(f)
+        w.writerow(CSV_FIELDNAMES)
+        # Cells in CSV_FIELDNAMES order
+        w.writerows(
+            (
+                r.crawler,
+                round(r.coverage, 3),
+                round(r.avg_response_time_ms) if not math.isnan(r.avg_response_time_ms) else "",
+                round(r.total_time_seconds) if not math.isnan(r.total_time_seconds) else "",
+                round(r.phone_fill_rate, 3),
+                round(r.social_fill_rate, 3),
+                round(r.address_fill_rate, 3),
+                r.total_datapoints,
             )
+            for r in rows
+        )
+
+
+def _fmt_pct(x: float) -> str:
+    return f"{x*100:.1f}%"
+
+
+def _fmt_ms(x: float) -> str:
+    return f"{x:.0f}ms" if not math.isnan(x) else "-"
+
+
+def _fmt_time(seconds: float) -> str:
+    """Format seconds as Xm Xs"""
+    if math.isnan(seconds):
+        return "-"
+    mins = int(seconds // 60)
+    secs = int(seconds % 60)
+    return f"{mins}m {secs}s"
+
+
+def _compute_quality(r: EvalRow) -> float:
+    """Quality = average of fill rates (matches choose_dataset.py logic)"""
+    parts = [r.phone_fill_rate, r.social_fill_rate, r.address_fill_rate]
+    present = [p for p in parts if p is not None]
+    return sum(present) / len(present) if present else 0.0
 
 
 def write_summary_md(rows: List[EvalRow], md_path: Path, coverage_weight: float = 0.6, quality_weight: float = 0.4) -> None:
     md_path.parent.mkdir(parents=True, exist_ok=True)
     # Expect exactly two rows (python, node). Handle n>=2 generically, but compute winners for first two.
-    def fmt_pct(x: float) -> str:
-        return f"{x*100:.1f}%"
-
-    def fmt_ms(x: float) -> str:
-        return f"{x:.0f}ms" if not math.isnan(x) else "-"
-
-    def fmt_time(seconds: float) -> str:
-        """Format seconds as Xm Xs"""
-        if math.isnan(seconds):
-            return "-"
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
-        return f"{mins}m {secs}s"
-
-    def compute_quality(r: EvalRow) -> float:
-        """Quality = average of fill rates (matches choose_dataset.py logic)"""
-        parts = [r.phone_fill_rate, r.social_fill_rate, r.address_fill_rate]
-        present = [p for p in parts if p is not None]
-        return sum(present) / len(present) if present else 0.0
-
     def compute_score(r: EvalRow) -> float:
         """Score = coverage_weight * coverage + quality_weight * quality"""
-        return coverage_weight * r.coverage + quality_weight * compute_quality(r)
+        return coverage_weight * r.coverage + quality_weight * _compute_quality(r)
 
     # Build lines
     lines: List[str] = ["# Crawler Comparison Report\n\n"]
@@ -191,7 +209,7 @@ def write_summary_md(rows: List[EvalRow], md_path: Path, coverage_weight: float
     # Coverage section
     lines.append("## Coverage\n")
     for r in rows:
-        lines.append(f"- {r.crawler.capitalize()}: {r.successes}/{r.total_sites} sites ({fmt_pct(r.coverage)})\n")
+        lines.append(f"- {r.crawler.capitalize()}: {r.successes}/{r.total_sites} sites ({_fmt_pct(r.coverage)})\n")
     # Winner: max coverage
     winner_cov = max(rows, key=lambda r: r.coverage)
     # Compare deltas against the other top competitor if exists
@@ -211,7 +229,7 @@ def write_summary_md(rows: List[EvalRow], md_path: Path, coverage_weight: float
     # Total crawl time subsection
     lines.append("### Total Crawl Time\n")
     for r in rows:
-        lines.append(f"- {r.crawler.capitalize()}: {fmt_time(r.total_time_seconds)}\n")
+        lines.append(f"- {r.crawler.capitalize()}: {_fmt_time(r.total_time_seconds)}\n")
     # Winner: min total_time_seconds
     winner_total_time = min(rows, key=lambda r: (r.total_time_seconds if not math.isnan(r.total_time_seconds) else float('inf')))
     if len(rows) >= 2:
@@ -228,7 +246,7 @@ def write_summary_md(rows: List[EvalRow], md_path: Path, coverage_weight: float
     # Avg response time subsection
     lines.append("### Avg Response Time (per request)\n")
     for r in rows:
-        lines.append(f"- {r.crawler.capitalize()}: {fmt_ms(r.avg_response_time_ms)}\n")
+        lines.append(f"- {r.crawler.capitalize()}: {_fmt_ms(r.avg_response_time_ms)}\n")
     # Winner: min avg_response_time_ms
     winner_speed = min(rows, key=lambda r: (r.avg_response_time_ms if not math.isnan(r.avg_response_time_ms) else float('inf')))
     if len(rows) >= 2:
@@ -264,7 +282,7 @@ def write_summary_md(rows: List[EvalRow], md_path: Path, coverage_weight: float
     lines.append("*Quality = avg(phone_fill_rate, social_fill_rate, address_fill_rate)*\n\n")
     
     # Compute and sort scores
-    scored_rows = [(r, compute_quality(r), compute_score(r)) for r in rows]
+    scored_rows = [(r, _compute_quality(r), compute_score(r)) for r in rows]
     scored_rows.sort(key=lambda x: x[2], reverse=True)
     
     for r, quality, score in scored_rows:
@@ -292,8 +310,7 @@ def write_summary_md(rows: List[EvalRow], md_path: Path, coverage_weight: float
                 lines.append("Speed difference is acceptable." if pct <= 20 else "Note: large speed difference.")
     lines.append("\n")
 
-    with md_path.open("w", encoding="utf-8") as f:
-        f.writelines(lines)
+    md_path.write_text("".join(lines), encoding="utf-8")
 
 
 def parse_results_args(pairs: List[str]) -> List[Tuple[str, Path]]:
@@ -306,6 +323,11 @@ def parse_results_args(pairs: List[str]) -> List[Tuple[str, Path]]:
     return results
 
 
+def _eval_dataset(name: str, path: Path, input_domains: List[str]) -> EvalRow:
+    """Worker task: evaluate one crawler's results file."""
+    return compute_eval_for_dataset(name, input_domains, iter_ndjson(path), path)
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Run Stage 1.2 evaluation and write reports")
     ap.add_argument("--websites", default="data/inputs/sample-websites.csv", help="Input CSV with 'domain' column")
@@ -321,6 +343,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     ap.add_argument("--out-dir", default="data/reports", help="Directory for output artifacts")
     ap.add_argument("--coverage-weight", type=float, default=0.6, help="Weight for coverage in final score (default: 0.6)")
     ap.add_argument("--quality-weight", type=float, default=0.4, help="Weight for quality in final score (default: 0.4)")
+    ap.add_argument("--workers", type=int, default=1, help="Evaluate datasets in this many processes (default: 1)")
     ap.add_argument("--no-color", action="store_true", help="Disable colored output")
 
     args = ap.parse_args(argv)
@@ -340,10 +363,22 @@ def main(argv: Optional[List[str]] = None) -> int:
     datasets = parse_results_args(list(args.results))
 
     rows: List[EvalRow] = []
-    for name, path in datasets:
-        records = parse_ndjson(path)
-        row = compute_eval_for_dataset(name, input_domains, records, path)
-        rows.append(row)
+    workers = min(args.workers, len(datasets))
+    if workers > 1:
+        # Datasets are independent; map() keeps rows in --results order
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            rows.extend(ex.map(
+                _eval_dataset,
+                [name for name, _ in datasets],
+                [path for _, path in datasets],
+                [input_domains] * len(datasets),
+            ))
+    else:
+        input_set = set(input_domains)  # Shared by every dataset below
+        for name, path in datasets:
+            records = iter_ndjson(path)  # Consumed once by the grouping pass
+            row = compute_eval_for_dataset(name, input_domains, records, path, input_set=input_set)
+            rows.append(row)
 
     # CSV + MD
     write_csv(rows, out_dir / "metrics.csv")
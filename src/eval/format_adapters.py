@@ -3,12 +3,16 @@ Format adapters for parsing different crawler output formats.
 
 Uses the Strategy pattern to handle multiple NDJSON formats in a clean,
 extensible way. Each crawler's format is encapsulated in its own adapter.
+The built-in formats are plain key tables (FIELD_SPEC), so a whole record is
+extracted with one extract_record() call instead of one call per field.
 """
 
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 
 class CrawlerFormatAdapter(ABC):
@@ -47,63 +51,180 @@ class CrawlerFormatAdapter(ABC):
     def get_domain(self, obj: Dict[str, Any]) -> str:
         """Extract domain (common across all formats)."""
         return str(obj.get("domain", "")).strip()
-
-
-class PythonNodeFormatAdapter(CrawlerFormatAdapter):
-    """Adapter for Python and Node crawler format."""
     
-    def get_http_status(self, obj: Dict[str, Any]) -> Optional[int]:
-        return obj.get("http_status")
+    def get_social_tuple(self, obj: Dict[str, Any]) -> Tuple[Optional[str], ...]:
+        """Social URLs in SOCIAL_FIELDS order, without building a dict."""
+        social = self.get_social_urls(obj)
+        return tuple(social.get(name) for name in SOCIAL_FIELDS)
     
-    def get_response_time_ms(self, obj: Dict[str, Any]) -> Optional[float]:
-        return obj.get("response_time_ms")
+    def extract_record(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract all fields except the domain as one flat dict."""
+        record: Dict[str, Any] = {
+            "http_status": self.get_http_status(obj),
+            "response_time_ms": self.get_response_time_ms(obj),
+            "phones": self.get_phones(obj),
+            "address": self.get_address(obj),
+            "error": self.get_error(obj),
+        }
+        record.update(self.get_social_urls(obj))
+        return record
+
+
+_ADAPTER_METHODS = (
+    "get_http_status",
+    "get_response_time_ms",
+    "get_phones",
+    "get_social_urls",
+    "get_address",
+    "get_error",
+)
+
+SOCIAL_FIELDS = ("facebook_url", "linkedin_url", "twitter_url", "instagram_url")
+
+# Output field -> input keys to try, in order
+FieldSpec = Dict[str, Tuple[str, ...]]
+
+
+def extract_record(obj: Dict[str, Any], spec: FieldSpec) -> Dict[str, Any]:
+    """
+    Extract every spec field from a raw crawler object in one pass.
     
-    def get_phones(self, obj: Dict[str, Any]) -> List[str]:
-        return list(obj.get("phones") or [])
+    Each field takes the first truthy value among its keys, else the value of
+    the last key (so a single-key field is returned as-is). Phones are always
+    a list; a decoded JSON list is fresh per record, so it is used uncopied.
+    """
+    get = obj.get
+    record: Dict[str, Any] = {}
+    for name, keys in spec.items():
+        value = None
+        for key in keys:
+            value = get(key)
+            if value:
+                break
+        record[name] = value
+    phones = record["phones"]
+    if type(phones) is not list:
+        record["phones"] = list(phones or ())
+    return record
+
+
+def compile_spec(spec: FieldSpec) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Specialize extract_record for one spec.
     
-    def get_social_urls(self, obj: Dict[str, Any]) -> Dict[str, Optional[str]]:
-        return {
-            "facebook_url": obj.get("facebook_url"),
-            "linkedin_url": obj.get("linkedin_url"),
-            "twitter_url": obj.get("twitter_url"),
-            "instagram_url": obj.get("instagram_url"),
-        }
+    Single-key fields become one dict comprehension and two-key fields a
+    plain `get(a) or get(b)`, which is the same first-truthy rule without
+    the inner loop. Longer key chains fall back to the generic walk.
+    """
+    singles = tuple((name, keys[0]) for name, keys in spec.items() if len(keys) == 1)
+    pairs = tuple((name, keys[0], keys[1]) for name, keys in spec.items() if len(keys) == 2)
+    chains = tuple((name, keys) for name, keys in spec.items() if len(keys) > 2)
     
-    def get_address(self, obj: Dict[str, Any]) -> Optional[str]:
-        return obj.get("address")
+    def extract(obj: Dict[str, Any]) -> Dict[str, Any]:
+        get = obj.get
+        record = {name: get(key) for name, key in singles}
+        for name, first, second in pairs:
+            record[name] = get(first) or get(second)
+        for name, keys in chains:
+            value = None
+            for key in keys:
+                value = get(key)
+                if value:
+                    break
+            record[name] = value
+        phones = record["phones"]
+        if type(phones) is not list:
+            record["phones"] = list(phones or ())
+        return record
     
-    def get_error(self, obj: Dict[str, Any]) -> Optional[str]:
-        return obj.get("error")
+    return extract
 
 
-class ScrapyFormatAdapter(CrawlerFormatAdapter):
-    """Adapter for Scrapy crawler format."""
+class KeyTableFormatAdapter(CrawlerFormatAdapter):
+    """Adapter whose fields are plain key lookups described by FIELD_SPEC."""
+    
+    FIELD_SPEC: FieldSpec = {}
+    
+    def __init__(self) -> None:
+        self._extract = compile_spec(self.FIELD_SPEC)
+    
+    def __reduce__(self):
+        # The compiled closure cannot be pickled; rebuild it in worker processes
+        return (self.__class__, ())
+    
+    def _field(self, obj: Dict[str, Any], name: str) -> Any:
+        value = None
+        for key in self.FIELD_SPEC[name]:
+            value = obj.get(key)
+            if value:
+                break
+        return value
     
     def get_http_status(self, obj: Dict[str, Any]) -> Optional[int]:
-        # Scrapy uses 'status_code' instead of 'http_status'
-        return obj.get("status_code")
+        return self._field(obj, "http_status")
     
     def get_response_time_ms(self, obj: Dict[str, Any]) -> Optional[float]:
-        return obj.get("response_time_ms")
+        return self._field(obj, "response_time_ms")
     
     def get_phones(self, obj: Dict[str, Any]) -> List[str]:
-        return list(obj.get("phones") or [])
+        phones = self._field(obj, "phones")
+        return phones if type(phones) is list else list(phones or ())
     
     def get_social_urls(self, obj: Dict[str, Any]) -> Dict[str, Optional[str]]:
-        # Scrapy uses 'facebook' instead of 'facebook_url', etc.
-        return {
-            "facebook_url": obj.get("facebook"),
-            "linkedin_url": obj.get("linkedin"),
-            "twitter_url": obj.get("twitter"),
-            "instagram_url": obj.get("instagram"),
-        }
+        return dict(zip(SOCIAL_FIELDS, self.get_social_tuple(obj)))
+    
+    def get_social_tuple(self, obj: Dict[str, Any]) -> Tuple[Optional[str], ...]:
+        field = self._field
+        return (
+            field(obj, "facebook_url"),
+            field(obj, "linkedin_url"),
+            field(obj, "twitter_url"),
+            field(obj, "instagram_url"),
+        )
     
     def get_address(self, obj: Dict[str, Any]) -> Optional[str]:
-        return obj.get("address")
+        return self._field(obj, "address")
     
     def get_error(self, obj: Dict[str, Any]) -> Optional[str]:
+        return self._field(obj, "error")
+    
+    def extract_record(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        return self._extract(obj)
+
+
+class PythonNodeFormatAdapter(KeyTableFormatAdapter):
+    """Adapter for Python and Node crawler format."""
+    
+    FIELD_SPEC: FieldSpec = {
+        "http_status": ("http_status",),
+        "response_time_ms": ("response_time_ms",),
+        "phones": ("phones",),
+        "facebook_url": ("facebook_url",),
+        "linkedin_url": ("linkedin_url",),
+        "twitter_url": ("twitter_url",),
+        "instagram_url": ("instagram_url",),
+        "address": ("address",),
+        "error": ("error",),
+    }
+
+
+class ScrapyFormatAdapter(KeyTableFormatAdapter):
+    """Adapter for Scrapy crawler format."""
+    
+    FIELD_SPEC: FieldSpec = {
+        # Scrapy uses 'status_code' instead of 'http_status'
+        "http_status": ("status_code",),
+        "response_time_ms": ("response_time_ms",),
+        "phones": ("phones",),
+        # Scrapy uses 'facebook' instead of 'facebook_url', etc.
+        "facebook_url": ("facebook",),
+        "linkedin_url": ("linkedin",),
+        "twitter_url": ("twitter",),
+        "instagram_url": ("instagram",),
+        "address": ("address",),
         # Scrapy can have 'error' or 'error_message'
-        return obj.get("error_message") or obj.get("error")
+        "error": ("error_message", "error"),
+    }
 
 
 class AutoDetectAdapter(CrawlerFormatAdapter):
@@ -119,11 +240,31 @@ class AutoDetectAdapter(CrawlerFormatAdapter):
             PythonNodeFormatAdapter(),
             ScrapyFormatAdapter(),
         ]
+        # Bound methods resolved once; the per-record path only calls them
+        self._bound: Dict[str, List[Callable[[Dict[str, Any]], Any]]] = {
+            name: [getattr(adapter, name) for adapter in self.adapters]
+            for name in _ADAPTER_METHODS
+        }
+        self._social_methods = [adapter.get_social_tuple for adapter in self.adapters]
+        # Key-table adapters collapse into one spec with concatenated keys
+        self._spec: Optional[FieldSpec] = None
+        self._extract: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+        if all(isinstance(adapter, KeyTableFormatAdapter) for adapter in self.adapters):
+            self._spec = {
+                name: tuple(dict.fromkeys(
+                    key for adapter in self.adapters for key in adapter.FIELD_SPEC[name]
+                ))
+                for name in PythonNodeFormatAdapter.FIELD_SPEC
+            }
+            self._extract = compile_spec(self._spec)
+    
+    def __reduce__(self):
+        # Bound methods and the compiled closure are rebuilt on unpickling
+        return (self.__class__, (self.adapters,))
     
     def _try_adapters(self, obj: Dict[str, Any], method_name: str) -> Any:
         """Try each adapter's method until one returns a non-None value."""
-        for adapter in self.adapters:
-            method = getattr(adapter, method_name)
+        for method in self._bound[method_name]:
             result = method(obj)
             if result is not None:
                 return result
@@ -140,43 +281,60 @@ class AutoDetectAdapter(CrawlerFormatAdapter):
     
     def get_social_urls(self, obj: Dict[str, Any]) -> Dict[str, Optional[str]]:
         # Special handling for social URLs - merge results from all adapters
-        result: Dict[str, Optional[str]] = {
-            "facebook_url": None,
-            "linkedin_url": None,
-            "twitter_url": None,
-            "instagram_url": None,
-        }
-        for adapter in self.adapters:
-            social = adapter.get_social_urls(obj)
-            for key, value in social.items():
-                if value is not None and result[key] is None:
-                    result[key] = value
-        return result
+        return dict(zip(SOCIAL_FIELDS, self.get_social_tuple(obj)))
+    
+    def get_social_tuple(self, obj: Dict[str, Any]) -> Tuple[Optional[str], ...]:
+        # Positional coalesce: first non-None per slot, stop once all are set
+        fb = li = tw = ig = None
+        for method in self._social_methods:
+            s_fb, s_li, s_tw, s_ig = method(obj)
+            if fb is None:
+                fb = s_fb
+            if li is None:
+                li = s_li
+            if tw is None:
+                tw = s_tw
+            if ig is None:
+                ig = s_ig
+            if fb is not None and li is not None and tw is not None and ig is not None:
+                break
+        return (fb, li, tw, ig)
     
     def get_address(self, obj: Dict[str, Any]) -> Optional[str]:
         return self._try_adapters(obj, "get_address")
     
     def get_error(self, obj: Dict[str, Any]) -> Optional[str]:
         return self._try_adapters(obj, "get_error")
+    
+    def extract_record(self, obj: Dict[str, Any]) -> Dict[str, Any]:
+        if self._extract is None:
+            return super().extract_record(obj)
+        return self._extract(obj)
+
 
+# Adapters hold no per-record state, so one instance per format is shared
+_PYTHON_NODE_ADAPTER = PythonNodeFormatAdapter()
+_SCRAPY_ADAPTER = ScrapyFormatAdapter()
+_DEFAULT_ADAPTER = AutoDetectAdapter([_PYTHON_NODE_ADAPTER, _SCRAPY_ADAPTER])
 
-# Format adapter registry for specific crawler types
-FORMAT_ADAPTERS: Dict[str, CrawlerFormatAdapter] = {
-    "python": PythonNodeFormatAdapter(),
-    "node": PythonNodeFormatAdapter(),
-    "scrapy": ScrapyFormatAdapter(),
-}
+# Format adapter registry for specific crawler types (read-only)
+FORMAT_ADAPTERS: Mapping[str, CrawlerFormatAdapter] = MappingProxyType({
+    "python": _PYTHON_NODE_ADAPTER,
+    "node": _PYTHON_NODE_ADAPTER,
+    "scrapy": _SCRAPY_ADAPTER,
+})
 
 
+@lru_cache(maxsize=16)
 def get_adapter_for_crawler(crawler_name: str) -> CrawlerFormatAdapter:
     """
     Get the appropriate format adapter for a crawler.
     
     Falls back to AutoDetectAdapter if crawler not registered.
     """
-    return FORMAT_ADAPTERS.get(crawler_name.lower(), AutoDetectAdapter())
+    return FORMAT_ADAPTERS.get(crawler_name.lower(), _DEFAULT_ADAPTER)
 
 
 def get_default_adapter() -> CrawlerFormatAdapter:
     """Get the default adapter (auto-detecting)."""
-    return AutoDetectAdapter()
+    return _DEFAULT_ADAPTER
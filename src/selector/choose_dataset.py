@@ -24,10 +24,20 @@ import argparse
 import csv
 import hashlib
 import json
-from dataclasses import dataclass
+import os
+import shutil
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+
+# orjson serializes in C; stdlib json is the fallback
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 try:
     from src.common.console import Console
 except Exception:  # pragma: no cover - fallback for script execution
@@ -39,49 +49,68 @@ except Exception:  # pragma: no cover - fallback for script execution
     from src.common.console import Console  # type: ignore
 
 
-@dataclass
+@dataclass(slots=True)
 class MetricsRow:
     crawler: str
     coverage: float  # 0..1
     phone_fill: float  # 0..1
     social_fill: float  # 0..1
     address_fill: float  # 0..1
-
-    @property
-    def quality(self) -> float:
-        parts = [self.phone_fill, self.social_fill, self.address_fill]
-        present = [p for p in parts if p is not None]
-        return sum(present) / len(present) if present else 0.0
-
-
-def _to_ratio(row: Dict[str, str], key_ratio: str, key_pct: str) -> Optional[float]:
-    if key_ratio in row and row[key_ratio] != "":
-        try:
-            v = float(row[key_ratio])
+    # Derived once at construction; scoring reads it per row
+    quality: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        parts = (self.phone_fill, self.social_fill, self.address_fill)
+        if None not in parts:
+            self.quality = sum(parts) / 3
+        else:
+            present = [p for p in parts if p is not None]
+            self.quality = sum(present) / len(present) if present else 0.0
+
+
+def _to_ratio(row: List[str], i_ratio: Optional[int], i_pct: Optional[int]) -> Optional[float]:
+    n = len(row)
+    if i_ratio is not None and i_ratio < n:
+        v = row[i_ratio]
+        if v:
+            try:
+                f = float(v)
+            except ValueError:
+                return None
             # If someone wrote 78 instead of 0.78, detect and correct
-            return v / 100.0 if v > 1.5 else v
-        except ValueError:
-            return None
-    if key_pct in row and row[key_pct] != "":
-        try:
-            return float(row[key_pct]) / 100.0
-        except ValueError:
-            return None
+            return f / 100.0 if f > 1.5 else f
+    if i_pct is not None and i_pct < n:
+        v = row[i_pct]
+        if v:
+            try:
+                return float(v) / 100.0
+            except ValueError:
+                return None
     return None
 
 
 def read_metrics(csv_path: Path) -> List[MetricsRow]:
     rows: List[MetricsRow] = []
     with csv_path.open("r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return rows
+        # Column positions resolved once from the header instead of a dict per row
+        idx = {c: i for i, c in enumerate(header)}
+        i_name = [idx[c] for c in ("crawler", "name", "dataset") if c in idx]
+        i_cov, i_cov_pct = idx.get("coverage"), idx.get("coverage_pct")
+        i_phone, i_phone_pct = idx.get("phone_fill_rate"), idx.get("phone_fill_pct")
+        i_social, i_social_pct = idx.get("social_fill_rate"), idx.get("social_fill_pct")
+        i_addr, i_addr_pct = idx.get("address_fill_rate"), idx.get("address_fill_pct")
         for r in reader:
-            crawler = (r.get("crawler") or r.get("name") or r.get("dataset") or "").strip()
+            crawler = next((r[i] for i in i_name if i < len(r) and r[i]), "").strip()
             if not crawler:
                 continue
-            coverage = _to_ratio(r, "coverage", "coverage_pct") or 0.0
-            phone = _to_ratio(r, "phone_fill_rate", "phone_fill_pct") or 0.0
-            social = _to_ratio(r, "social_fill_rate", "social_fill_pct") or 0.0
-            address = _to_ratio(r, "address_fill_rate", "address_fill_pct") or 0.0
+            coverage = _to_ratio(r, i_cov, i_cov_pct) or 0.0
+            phone = _to_ratio(r, i_phone, i_phone_pct) or 0.0
+            social = _to_ratio(r, i_social, i_social_pct) or 0.0
+            address = _to_ratio(r, i_addr, i_addr_pct) or 0.0
             rows.append(MetricsRow(crawler=crawler, coverage=coverage, phone_fill=phone, social_fill=social, address_fill=address))
     return rows
 
@@ -97,21 +126,75 @@ def parse_outputs_map(pairs: List[str]) -> Dict[str, Path]:
 
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            h.update(chunk)
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: read/update loop runs in C
+            h = hashlib.file_digest(f, "sha256")
+        else:
+            h = hashlib.sha256()
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                h.update(view[:n])
     return f"sha256:{h.hexdigest()}"
 
 
 def count_lines(path: Path) -> int:
+    """Count newlines with bytes.count over 1 MiB blocks; no decoding."""
     n = 0
-    with path.open("r", encoding="utf-8", errors="ignore") as f:
-        for _ in f:
-            n += 1
+    last = b"\n"
+    with path.open("rb") as f:
+        while chunk := f.read(1 << 20):
+            n += chunk.count(b"\n")
+            last = chunk[-1:]
+    if last != b"\n":
+        n += 1  # Last line has no trailing newline
     return n
 
 
+def copy_dataset(source: Path, target: Path) -> None:
+    """
+    Copy source to target without moving bytes through Python.
+    
+    os.copy_file_range lets the filesystem share extents (reflink on
+    XFS/Btrfs) or copy in-kernel; shutil.copyfile (sendfile on Linux) is
+    the fallback when it is unavailable or refused, e.g. across devices.
+    """
+    if target.exists() and os.path.samefile(source, target):
+        return  # Already staged; opening the target for writing would truncate the source
+    if hasattr(os, "copy_file_range"):
+        try:
+            with source.open("rb") as src:
+                remaining = os.fstat(src.fileno()).st_size  # Sized before the target is opened
+                with target.open("wb") as dst:
+                    while remaining > 0:
+                        copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                        if copied == 0:
+                            break
+                        remaining -= copied
+            if remaining == 0:
+                return
+        except OSError:  # EXDEV, EOPNOTSUPP, ENOSYS, ...
+            pass
+    shutil.copyfile(source, target)
+
+
+def hash_and_count(path: Path) -> Tuple[str, int]:
+    """sha256_file and count_lines in one read of the file."""
+    h = hashlib.sha256()
+    n = 0
+    last = 0x0A  # An empty file needs no trailing-line correction
+    buf = bytearray(1 << 20)
+    view = memoryview(buf)
+    with path.open("rb") as f:
+        while r := f.readinto(buf):
+            h.update(view[:r])
+            n += buf.count(b"\n", 0, r)
+            last = buf[r - 1]
+    if last != 0x0A:
+        n += 1  # Last line has no trailing newline
+    return f"sha256:{h.hexdigest()}", n
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     ap = argparse.ArgumentParser(description="Stage 1.3 - Choose dataset based on metrics and stage it")
     ap.add_argument("--metrics", default="data/reports/metrics.csv", help="Path to metrics CSV")
@@ -142,15 +225,12 @@ def main(argv: Optional[List[str]] = None) -> int:
     if not metrics:
         raise SystemExit(f"No metrics found in {metrics_csv}")
 
-    # Compute scores
-    scored: List[Tuple[str, float]] = []
-    for m in metrics:
-        score = args.coverage_weight * m.coverage + args.quality_weight * m.quality
-        scored.append((m.crawler, score))
-
-    # Pick winner
-    winner = max(scored, key=lambda t: t[1])
-    winner_name, winner_score = winner
+    # Score and pick the winner in one pass (first row wins ties)
+    cov_w, q_w = args.coverage_weight, args.quality_weight
+    winner_name, winner_score = max(
+        ((m.crawler, cov_w * m.coverage + q_w * m.quality) for m in metrics),
+        key=itemgetter(1),
+    )
 
     if winner_name not in outputs_map:
         raise SystemExit(f"No output NDJSON configured for dataset '{winner_name}'")
@@ -159,11 +239,10 @@ def main(argv: Optional[List[str]] = None) -> int:
         raise SystemExit(f"Source NDJSON not found: {source_path}")
 
     target_path = out_dir / "crawl_results.ndjson"
-    target_path.write_bytes(source_path.read_bytes())
+    copy_dataset(source_path, target_path)
 
     # Manifest
-    checksum = sha256_file(target_path)
-    record_count = count_lines(target_path)
+    checksum, record_count = hash_and_count(target_path)
     dataset_id = f"crawl_{datetime.now(timezone.utc).date()}_{winner_name}"
     manifest = {
         "dataset_id": dataset_id,
@@ -175,13 +254,17 @@ def main(argv: Optional[List[str]] = None) -> int:
         "schema_version": args.schema_version,
         "created_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
     }
-    with (out_dir / "manifest.json").open("w", encoding="utf-8") as f:
-        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    manifest_path = out_dir / "manifest.json"
+    if orjson is not None:
+        manifest_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    else:
+        with manifest_path.open("w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
 
     c = Console(no_color=args.no_color)
     c.success(f"Winner: {winner_name} (score={winner_score:.6f})")
     c.info(f"Staged: {target_path}")
-    c.info(f"Manifest: {out_dir / 'manifest.json'}")
+    c.info(f"Manifest: {manifest_path}")
     return 0
 
 
@@ -13,20 +13,32 @@ from src.api.app import app
 from src.api.models import CompanyInput, MatchResponse
 
 
-# Test client
-client = TestClient(app)
+PHONE_FORMATS = [
+    "555-1234",
+    "(555) 123-4567",
+    "+1-555-123-4567",
+    "555.123.4567",
+    "5551234567",
+]
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient (and app startup) shared by every test in the session."""
+    with TestClient(app) as c:
+        yield c
 
 
 class TestHealthAndMetrics:
     """Test basic endpoints."""
 
-    def test_healthz_endpoint(self):
+    def test_healthz_endpoint(self, client):
         """Test health check returns 200."""
         response = client.get("/healthz")
         assert response.status_code == 200
         assert response.json() == {"status": "ok"}
 
-    def test_metrics_endpoint(self):
+    def test_metrics_endpoint(self, client):
         """Test metrics endpoint is available."""
         response = client.get("/metrics")
         assert response.status_code in (200, 503)  # 503 if prometheus_client not installed
@@ -35,14 +47,14 @@ class TestHealthAndMetrics:
 class TestMatchEndpointValidation:
     """Test input validation for /match endpoint."""
 
-    def test_match_requires_company_name(self):
+    def test_match_requires_company_name(self, client):
         """Test that company_name is required."""
         response = client.post("/match", json={})
         assert response.status_code == 422  # Validation error
         error = response.json()
         assert "company_name" in str(error).lower()
 
-    def test_match_accepts_minimal_input(self):
+    def test_match_accepts_minimal_input(self, client):
         """Test match with only company name."""
         response = client.post("/match", json={
             "company_name": "Test Company"
@@ -54,7 +66,7 @@ class TestMatchEndpointValidation:
         assert "company" in data
         assert "score_breakdown" in data
 
-    def test_match_accepts_all_fields(self):
+    def test_match_accepts_all_fields(self, client):
         """Test match with all fields populated."""
         response = client.post("/match", json={
             "company_name": "Arnby",
@@ -67,7 +79,7 @@ class TestMatchEndpointValidation:
         data = response.json()
         assert "match_found" in data
 
-    def test_match_accepts_optional_fields_as_none(self):
+    def test_match_accepts_optional_fields_as_none(self, client):
         """Test that optional fields can be None."""
         response = client.post("/match", json={
             "company_name": "Test",
@@ -78,7 +90,7 @@ class TestMatchEndpointValidation:
         })
         assert response.status_code == 200
 
-    def test_match_rejects_empty_company_name(self):
+    def test_match_rejects_empty_company_name(self, client):
         """Test that empty company name is rejected."""
         response = client.post("/match", json={
             "company_name": "",
@@ -98,7 +110,7 @@ class TestMatchEndpointValidation:
 class TestMatchResponseStructure:
     """Test response structure and data types."""
 
-    def test_match_response_structure(self):
+    def test_match_response_structure(self, client):
         """Test that response has correct structure."""
         response = client.post("/match", json={
             "company_name": "Test Company",
@@ -121,7 +133,7 @@ class TestMatchResponseStructure:
         # Confidence range
         assert 0.0 <= data["confidence"] <= 1.0
 
-    def test_match_found_response_has_company_data(self):
+    def test_match_found_response_has_company_data(self, client):
         """Test that successful match includes company data."""
         response = client.post("/match", json={
             "company_name": "Test Company",
@@ -140,7 +152,7 @@ class TestMatchResponseStructure:
             assert "phones" in company
             assert isinstance(company["phones"], list)
 
-    def test_no_match_response_has_null_company(self):
+    def test_no_match_response_has_null_company(self, client):
         """Test that no match returns null company."""
         response = client.post("/match", json={
             "company_name": "NonexistentCompanyXYZ123456789",
@@ -157,7 +169,7 @@ class TestMatchResponseStructure:
 class TestMatchScoring:
     """Test matching algorithm and scoring."""
 
-    def test_score_breakdown_structure(self):
+    def test_score_breakdown_structure(self, client):
         """Test that score breakdown contains expected components."""
         response = client.post("/match", json={
             "company_name": "Test",
@@ -172,7 +184,7 @@ class TestMatchScoring:
         # Breakdown should have scoring components when candidates exist
         # (may be empty if no candidates found)
 
-    def test_domain_match_has_high_confidence(self):
+    def test_domain_match_has_high_confidence(self, client):
         """Test that perfect domain match has high confidence (if match found)."""
         response = client.post("/match", json={
             "company_name": "Test",
@@ -185,7 +197,7 @@ class TestMatchScoring:
         if data["match_found"] and data.get("company", {}).get("domain") == "test.com":
             assert data["confidence"] >= 0.3  # Above minimum threshold
 
-    def test_minimum_confidence_threshold_applied(self):
+    def test_minimum_confidence_threshold_applied(self, client):
         """Test that minimum confidence threshold filters low matches."""
         response = client.post("/match", json={
             "company_name": "A",  # Single letter - likely low confidence
@@ -202,7 +214,7 @@ class TestMatchScoring:
 class TestMatchNormalization:
     """Test input normalization handling."""
 
-    def test_domain_normalization(self):
+    def test_domain_normalization(self, client):
         """Test that domain is normalized (www removed, lowercased)."""
         response = client.post("/match", json={
             "company_name": "Test",
@@ -211,7 +223,7 @@ class TestMatchNormalization:
         assert response.status_code == 200
         # Normalization happens internally; verify no errors
 
-    def test_phone_normalization(self):
+    def test_phone_normalization(self, client):
         """Test that phone numbers are normalized."""
         response = client.post("/match", json={
             "company_name": "Test",
@@ -220,7 +232,7 @@ class TestMatchNormalization:
         assert response.status_code == 200
         # Normalization happens internally; verify no errors
 
-    def test_facebook_normalization(self):
+    def test_facebook_normalization(self, client):
         """Test that Facebook URLs are normalized."""
         response = client.post("/match", json={
             "company_name": "Test",
@@ -229,7 +241,7 @@ class TestMatchNormalization:
         assert response.status_code == 200
         # Normalization happens internally; verify no errors
 
-    def test_handles_malformed_urls(self):
+    def test_handles_malformed_urls(self, client):
         """Test that malformed URLs don't crash the API."""
         response = client.post("/match", json={
             "company_name": "Test",
@@ -243,7 +255,7 @@ class TestMatchNormalization:
 class TestErrorHandling:
     """Test error handling and resilience."""
 
-    def test_invalid_json_returns_422(self):
+    def test_invalid_json_returns_422(self, client):
         """Test that invalid JSON returns validation error."""
         response = client.post("/match", 
             data="not valid json",
@@ -251,7 +263,7 @@ class TestErrorHandling:
         )
         assert response.status_code == 422
 
-    def test_extra_fields_ignored(self):
+    def test_extra_fields_ignored(self, client):
         """Test that extra fields are ignored gracefully."""
         response = client.post("/match", json={
             "company_name": "Test",
@@ -261,7 +273,7 @@ class TestErrorHandling:
         # Pydantic will ignore extra fields by default
         assert response.status_code == 200
 
-    def test_handles_es_unavailable_gracefully(self):
+    def test_handles_es_unavailable_gracefully(self, client):
         """Test that API handles Elasticsearch being unavailable."""
         # This test will pass even if ES is down - API should not crash
         response = client.post("/match", json={
@@ -277,16 +289,16 @@ class TestErrorHandling:
 class TestConcurrency:
     """Test concurrent request handling."""
 
-    def test_multiple_sequential_requests(self):
+    @pytest.mark.parametrize("i", range(5))
+    def test_multiple_sequential_requests(self, client, i):
         """Test that API handles multiple requests sequentially."""
-        for i in range(5):
-            response = client.post("/match", json={
-                "company_name": f"Test {i}",
-                "website": f"test{i}.com"
-            })
-            assert response.status_code == 200
+        response = client.post("/match", json={
+            "company_name": f"Test {i}",
+            "website": f"test{i}.com"
+        })
+        assert response.status_code == 200
 
-    def test_different_inputs_get_different_results(self):
+    def test_different_inputs_get_different_results(self, client):
         """Test that different inputs produce independent results."""
         response1 = client.post("/match", json={
             "company_name": "Company A",
@@ -310,7 +322,7 @@ class TestConcurrency:
 class TestEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_very_long_company_name(self):
+    def test_very_long_company_name(self, client):
         """Test with very long company name."""
         long_name = "A" * 1000
         response = client.post("/match", json={
@@ -318,21 +330,21 @@ class TestEdgeCases:
         })
         assert response.status_code == 200
 
-    def test_special_characters_in_name(self):
+    def test_special_characters_in_name(self, client):
         """Test company name with special characters."""
         response = client.post("/match", json={
             "company_name": "Test & Co. <Company> 'Name' \"Inc.\""
         })
         assert response.status_code == 200
 
-    def test_unicode_in_company_name(self):
+    def test_unicode_in_company_name(self, client):
         """Test company name with Unicode characters."""
         response = client.post("/match", json={
             "company_name": "Café München 北京 🏢"
         })
         assert response.status_code == 200
 
-    def test_all_fields_empty_strings(self):
+    def test_all_fields_empty_strings(self, client):
         """Test behavior with empty strings for all optional fields."""
         response = client.post("/match", json={
             "company_name": "Test",
@@ -343,7 +355,7 @@ class TestEdgeCases:
         })
         assert response.status_code == 200
 
-    def test_whitespace_only_fields(self):
+    def test_whitespace_only_fields(self, client):
         """Test behavior with whitespace-only fields."""
         response = client.post("/match", json={
             "company_name": "Test",
@@ -356,7 +368,7 @@ class TestEdgeCases:
 class TestRealWorldScenarios:
     """Test realistic use cases from the CSV sample."""
 
-    def test_domain_only_match(self):
+    def test_domain_only_match(self, client):
         """Test matching with only domain (common scenario)."""
         response = client.post("/match", json={
             "company_name": "Unknown",
@@ -366,7 +378,7 @@ class TestRealWorldScenarios:
         data = response.json()
         assert isinstance(data["match_found"], bool)
 
-    def test_name_only_match(self):
+    def test_name_only_match(self, client):
         """Test matching with only company name."""
         response = client.post("/match", json={
             "company_name": "Test Company Inc"
@@ -375,7 +387,7 @@ class TestRealWorldScenarios:
         data = response.json()
         assert isinstance(data["match_found"], bool)
 
-    def test_name_and_domain_match(self):
+    def test_name_and_domain_match(self, client):
         """Test matching with both name and domain."""
         response = client.post("/match", json={
             "company_name": "Test Company",
@@ -385,24 +397,16 @@ class TestRealWorldScenarios:
         data = response.json()
         assert isinstance(data["match_found"], bool)
 
-    def test_phone_with_various_formats(self):
+    @pytest.mark.parametrize("phone_format", PHONE_FORMATS)
+    def test_phone_with_various_formats(self, client, phone_format):
         """Test phone matching with different formats."""
-        formats = [
-            "555-1234",
-            "(555) 123-4567",
-            "+1-555-123-4567",
-            "555.123.4567",
-            "5551234567"
-        ]
-        
-        for phone_format in formats:
-            response = client.post("/match", json={
-                "company_name": "Test",
-                "phone_number": phone_format
-            })
-            assert response.status_code == 200
+        response = client.post("/match", json={
+            "company_name": "Test",
+            "phone_number": phone_format
+        })
+        assert response.status_code == 200
 
-    def test_social_media_matching(self):
+    def test_social_media_matching(self, client):
         """Test matching with social media URLs."""
         response = client.post("/match", json={
             "company_name": "Test Company",
@@ -22,6 +22,15 @@ class TestConfigProfiles:
         assert config.http.timeout_seconds > 0
         assert config.http.concurrency > 0
     
+    def test_load_is_cached_per_profile(self):
+        """Repeated loads reuse the parsed config instead of re-reading YAML."""
+        assert load_crawler_config() is load_crawler_config()
+        assert load_crawler_config(profile="aggressive") is not load_crawler_config()
+    
+    def test_http2_is_opt_in(self):
+        """HTTP/2 download handler stays off unless configured."""
+        assert load_crawler_config().http.http2 is False
+    
     def test_load_aggressive_profile(self):
         """Aggressive profile overrides concurrency and timeout."""
         config = load_crawler_config(profile="aggressive")
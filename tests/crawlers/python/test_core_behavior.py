@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import io
+import socket
 import sys
 from dataclasses import asdict
 
+import httpx
 import pytest
 
+from src.crawlers.python import main as crawler_main
 from src.crawlers.python.main import _domain_from_value, maybe_log_browser_fallback
 
 
@@ -45,3 +49,125 @@ def test_maybe_log_browser_fallback_caps() -> None:
     finally:
         sys.stdout = orig
     assert "browser fallback" in buf.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_dns_failure_short_circuits_before_http(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_getaddrinfo(*args, **kwargs):
+        raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+    class ExplodingClient:
+        def __init__(self, *args, **kwargs):
+            raise AssertionError("HTTP client must not be built for unresolvable domains")
+
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(loop, "getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(httpx, "AsyncClient", ExplodingClient)
+    monkeypatch.setattr(crawler_main, "_ROBOTS_CACHE", None)
+
+    result = await crawler_main.fetch_and_extract("nope.invalid", timeout=1.0, user_agent="UA")
+    assert result.error == "DNS error: domain not found"
+    assert result.http_status == 0
+
+
+@pytest.mark.asyncio
+async def test_dns_precheck_caches_addresses(monkeypatch: pytest.MonkeyPatch) -> None:
+    lookups: list[str] = []
+
+    async def fake_getaddrinfo(host, *args, **kwargs):
+        lookups.append(host)
+        return [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 443)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("10.0.0.1", 443)),
+            (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("2001:db8::1", 443, 0, 0)),
+        ]
+
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(loop, "getaddrinfo", fake_getaddrinfo)
+    monkeypatch.setattr(crawler_main, "_DNS_CACHE", crawler_main.OrderedDict())
+
+    assert await crawler_main._dns_resolves("cached.test")
+    assert await crawler_main._dns_resolves("cached.test")
+    assert lookups == ["cached.test"]
+    assert crawler_main._DNS_CACHE["cached.test"] == ("10.0.0.1", "2001:db8::1")
+
+
+@pytest.mark.asyncio
+async def test_transport_connects_to_cached_address(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def handle(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\nConnection: close\r\n\r\nok")
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    monkeypatch.setattr(crawler_main, "_DNS_CACHE", crawler_main.OrderedDict())
+    # Not resolvable: the request only succeeds through the cached address
+    crawler_main._cache_addresses("cached.invalid", ("127.0.0.1",))
+    crawler_main._ensure_httpx()
+
+    limits = httpx.Limits(keepalive_expiry=30.0)
+    try:
+        async with httpx.AsyncClient(transport=crawler_main._build_transport(limits)) as client:
+            response = await client.get(f"http://cached.invalid:{port}/")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert response.status_code == 200
+    assert response.text == "ok"
+    assert response.request.headers["Host"] == f"cached.invalid:{port}"
+
+
+@pytest.mark.asyncio
+async def test_fetch_caps_body_and_reports_raw_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(crawler_main, "_MAX_BODY_BYTES", 1024)
+    payload = ("<p>café</p>" * 500).encode("latin-1")
+
+    def handler(request):
+        return httpx.Response(
+            200, content=payload, headers={"Content-Type": "text/html; charset=latin-1"}
+        )
+
+    transport = httpx.MockTransport(handler)
+    async with httpx.AsyncClient(transport=transport) as client:
+        response, body, _ = await crawler_main._fetch_with_protocol(
+            "example.com", "https", 1.0, "UA", client
+        )
+
+    assert len(body) == 1024
+    html = crawler_main._decode_body(body, response.charset_encoding)
+    assert html.startswith("<p>café</p>")
+
+
+@pytest.mark.asyncio
+async def test_ssl_failure_on_fast_path_falls_back_to_http(monkeypatch: pytest.MonkeyPatch) -> None:
+    seen: list[str] = []
+
+    def handler(request):
+        seen.append(request.url.scheme)
+        if request.url.scheme == "https":
+            raise httpx.ConnectError("[SSL: CERTIFICATE_VERIFY_FAILED]", request=request)
+        return httpx.Response(200, text="<title>Acme Corp</title>")
+
+    real_client = httpx.AsyncClient
+
+    def client_with_transport(*args, **kwargs):
+        kwargs["transport"] = httpx.MockTransport(handler)
+        kwargs.pop("http2", None)
+        return real_client(*args, **kwargs)
+
+    async def resolves(domain: str, timeout: float = 3.0) -> bool:
+        return True
+
+    monkeypatch.setattr(crawler_main, "_dns_resolves", resolves)
+    monkeypatch.setattr(crawler_main, "_ROBOTS_CACHE", None)
+    monkeypatch.setattr(crawler_main, "_PROTOCOLS", ("https", "http"))
+    monkeypatch.setattr(httpx, "AsyncClient", client_with_transport)
+
+    result = await crawler_main.fetch_and_extract("acme.test", timeout=1.0, user_agent="UA")
+    assert seen == ["https", "http"]
+    assert result.error is None
+    assert result.http_status == 200
+    assert result.url == "http://acme.test"
@@ -81,6 +81,61 @@ def test_extraction_utils_integration():
     assert isinstance(phones, list)
 
 
+def _load_lite_company_module():
+    import importlib.util
+
+    # Loaded by path: the full Scrapy crawler's phidi_spider package is already on sys.path
+    spider_path = Path(__file__).resolve().parents[3] / "src" / "crawlers" / "scrapy-lite" / "phidi_spider" / "spiders" / "company.py"
+    spec = importlib.util.spec_from_file_location("scrapy_lite_company", spider_path)
+    company = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(company)
+    return company
+
+
+_LATIN1_HTML_BODY = (
+    '<p>Café Müller, 12 Hauptstraße Street, Köln</p>'
+    '<a href="https://facebook.com/cafe-m%C3%BCller">FB</a> Call (555) 123-4567'
+)
+
+
+def _assert_fields_match_text(company, response):
+    from src.crawlers.python.extract import extract_address, extract_facebook, extract_phones
+
+    content_type = response.headers.get(b"Content-Type", b"").decode("latin-1")
+    fields = company._extract_fields(response.body, content_type)
+
+    assert fields["facebook"] == extract_facebook(response.text)
+    assert fields["phones"] == extract_phones(response.text)
+    assert fields["address"] == extract_address(response.text)
+
+
+def test_lite_extract_fields_decodes_like_response_text():
+    """Off-reactor decoding of response.body matches response.text on non-UTF-8 pages."""
+    from scrapy.http import HtmlResponse
+
+    company = _load_lite_company_module()
+    html = '<html><head><meta charset="iso-8859-1"></head><body>' + _LATIN1_HTML_BODY + '</body></html>'
+    response = HtmlResponse(url="https://example.com", body=html.encode("latin-1"))
+
+    _assert_fields_match_text(company, response)
+
+
+def test_lite_extract_fields_without_declared_charset():
+    """No header or <meta> charset: the worker auto-detects the same encoding as response.text."""
+    from scrapy.http import HtmlResponse
+
+    company = _load_lite_company_module()
+    html = '<html><body>' + _LATIN1_HTML_BODY + '</body></html>'
+    response = HtmlResponse(
+        url="https://example.com",
+        headers={"Content-Type": "text/html"},
+        body=html.encode("latin-1"),
+    )
+
+    _assert_fields_match_text(company, response)
+    assert response.encoding == "cp1252"
+
+
 if __name__ == '__main__':
     import pytest
     pytest.main([__file__, '-v'])
@@ -74,3 +74,204 @@ def test_spider_import():
     
     assert CompanySpider is not None
     assert CompanySpider.name == 'company'
+
+
+def test_http_fallback_on_ssl_errors():
+    """SSL failures (by type or by message) retry over HTTP; other errors don't."""
+    import logging
+
+    import scrapy
+    from twisted.internet.error import ConnectionRefusedError, SSLError
+    from phidi_spider.middlewares import HttpFallbackMiddleware
+
+    class _Spider:
+        logger = logging.getLogger("test")
+
+    middleware = HttpFallbackMiddleware()
+    middleware.fallback_enabled = True
+    request = scrapy.Request("https://example.com")
+
+    retried = middleware.process_exception(request, SSLError(), _Spider())
+    assert retried.url == "http://example.com"
+    assert retried.meta['fallback_attempted'] is True
+
+    wrapped = Exception("[<Failure instance: TLS handshake failed>]")
+    assert middleware.process_exception(request, wrapped, _Spider()).url == "http://example.com"
+
+    assert middleware.process_exception(request, ConnectionRefusedError(), _Spider()) is None
+
+
+def test_pipeline_writes_ndjson(tmp_path):
+    """Pipeline writes one UTF-8 JSON object per line."""
+    import json
+
+    from phidi_spider.pipelines import JsonLinesExportPipeline
+
+    class _Spider:
+        output_path = str(tmp_path / "out.ndjson")
+
+    pipeline = JsonLinesExportPipeline()
+    pipeline.open_spider(_Spider())
+    pipeline.process_item({'domain': 'café.fr', 'phones': ['+33123456789']}, _Spider())
+    pipeline.process_item({'domain': 'b.com', 'phones': []}, _Spider())
+    pipeline.close_spider(_Spider())
+
+    lines = (tmp_path / "out.ndjson").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)['domain'] for line in lines] == ['café.fr', 'b.com']
+
+
+def test_pipeline_writes_dataclass_records(tmp_path, monkeypatch):
+    """Pipeline serializes dataclass items with and without orjson."""
+    import json
+    from dataclasses import dataclass, field
+
+    from phidi_spider import pipelines
+
+    @dataclass(slots=True)
+    class _Record:
+        domain: str
+        phones: list = field(default_factory=list)
+
+    class _Spider:
+        output_path = str(tmp_path / "out.ndjson")
+
+    for orjson_module in (pipelines.orjson, None):
+        monkeypatch.setattr(pipelines, "orjson", orjson_module)
+        pipeline = pipelines.JsonLinesExportPipeline()
+        pipeline.open_spider(_Spider())
+        pipeline.process_item(_Record('a.com', ['+15550100']), _Spider())
+        pipeline.close_spider(_Spider())
+
+        line = (tmp_path / "out.ndjson").read_text(encoding="utf-8")
+        assert json.loads(line) == {'domain': 'a.com', 'phones': ['+15550100']}
+
+
+def test_user_agent_rotation_sets_header():
+    """Rotation picks one of the pre-encoded user-agents."""
+    import scrapy
+    from phidi_spider.middlewares import UserAgentRotationMiddleware
+
+    middleware = UserAgentRotationMiddleware()
+    middleware.user_agents = (b'UA-One', b'UA-Two')
+    request = scrapy.Request("https://example.com")
+
+    assert middleware.process_request(request, spider=None) is None
+    assert request.headers[b'User-Agent'] in middleware.user_agents
+
+
+def test_ttl_resolver_expires_cached_entries(monkeypatch):
+    """Test that cached DNS entries are served until their TTL elapses."""
+    from scrapy.resolver import dnscache
+    from twisted.internet.base import ThreadedResolver
+    from twisted.internet import defer
+    from phidi_spider import resolvers
+    
+    lookups = []
+    
+    def fake_lookup(self, name, timeout=()):
+        lookups.append(name)
+        return defer.succeed("10.0.0.%d" % len(lookups))
+    
+    monkeypatch.setattr(ThreadedResolver, "getHostByName", fake_lookup)
+    now = [1000.0]
+    monkeypatch.setattr(resolvers.time, "monotonic", lambda: now[0])
+    dnscache.pop("example.com", None)
+    
+    resolver = resolvers.TTLResolver(None, cache_size=100, timeout=5.0, ttl=300)
+    results = []
+    resolver.getHostByName("example.com").addCallback(results.append)
+    resolver.getHostByName("example.com").addCallback(results.append)
+    assert results == ["10.0.0.1", "10.0.0.1"]
+    assert lookups == ["example.com"]
+    
+    # Near expiry: cached IP served, refresh runs in the background
+    now[0] += 250
+    resolver.getHostByName("example.com").addCallback(results.append)
+    assert results[-1] == "10.0.0.1"
+    assert len(lookups) == 2
+    
+    # Past the refreshed TTL: re-resolved on the request path
+    now[0] += 400
+    resolver.getHostByName("example.com").addCallback(results.append)
+    assert results[-1] == "10.0.0.3"
+    dnscache.pop("example.com", None)
+
+
+def test_ttl_resolver_prefetch_warms_cache(monkeypatch):
+    """Test that prefetched names are served from cache without another lookup."""
+    from scrapy.resolver import dnscache
+    from twisted.internet.base import ThreadedResolver
+    from twisted.internet import defer
+    from phidi_spider import resolvers
+    
+    lookups = []
+    
+    def fake_lookup(self, name, timeout=()):
+        lookups.append(name)
+        return defer.succeed("10.0.0.1")
+    
+    monkeypatch.setattr(ThreadedResolver, "getHostByName", fake_lookup)
+    dnscache.pop("prefetch.example", None)
+    
+    resolver = resolvers.TTLResolver(None, cache_size=100, timeout=5.0, ttl=300)
+    resolver.prefetch("prefetch.example")
+    resolver.prefetch("prefetch.example")
+    results = []
+    resolver.getHostByName("prefetch.example").addCallback(results.append)
+    
+    assert results == ["10.0.0.1"]
+    assert lookups == ["prefetch.example"]
+    dnscache.pop("prefetch.example", None)
+
+
+def test_content_type_filter_stops_non_html_downloads():
+    """Test that non-HTML page bodies are dropped once headers arrive."""
+    import pytest
+    from scrapy import Request
+    from scrapy.exceptions import StopDownload
+    from scrapy.http import Headers
+    from phidi_spider.middlewares import ContentTypeFilterMiddleware
+    
+    middleware = ContentTypeFilterMiddleware()
+    page = Request("https://example.com", meta={'domain': 'example.com'})
+    
+    for ctype in ('application/pdf', 'image/png', 'application/zip', 'font/woff2'):
+        with pytest.raises(StopDownload):
+            middleware.headers_received(Headers({'Content-Type': ctype}), 0, page, None)
+    
+    # HTML, generic/unknown types and non-page requests download normally
+    middleware.headers_received(Headers({'Content-Type': 'text/html; charset=utf-8'}), 0, page, None)
+    middleware.headers_received(Headers({'Content-Type': 'application/octet-stream'}), 0, page, None)
+    middleware.headers_received(Headers({'Content-Type': 'binary/octet-stream'}), 0, page, None)
+    middleware.headers_received(Headers({}), 0, page, None)
+    robots = Request("https://example.com/robots.txt")
+    middleware.headers_received(Headers({'Content-Type': 'text/plain'}), 0, robots, None)
+
+
+def test_octet_stream_html_is_sniffed_as_html():
+    """Test that mislabelled HTML passed through the filter still becomes an HtmlResponse."""
+    from scrapy.http import HtmlResponse
+    from scrapy.responsetypes import responsetypes
+    
+    body = b'<!DOCTYPE html><html><body>Call (555) 123-4567</body></html>'
+    cls = responsetypes.from_args(
+        headers={'Content-Type': 'application/octet-stream'}, url='https://example.com', body=body
+    )
+    
+    assert issubclass(cls, HtmlResponse)
+
+
+def test_address_texts_single_walk_order():
+    """Test that address text keeps <address> text first and skips nested div duplicates."""
+    import lxml.html
+    from phidi_spider.spiders.company import _address_texts
+    
+    root = lxml.html.fromstring(
+        '<html><body>'
+        '<div class="contact">a<div class="location">b<address>c<b>d</b>e</address></div>f</div>'
+        '<address>g<!-- note -->h</address>'
+        '<div class="footer">ignored</div>'
+        '</body></html>'
+    )
+    
+    assert _address_texts(root) == ['c', 'e', 'g', 'h', 'a', 'b', 'c', 'd', 'e', 'f']
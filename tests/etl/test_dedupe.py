@@ -0,0 +1,38 @@
+"""Test suite for domain deduplication."""
+import random
+
+from src.etl.dedupe import completeness_score, dedupe_by_domain
+
+
+def test_dedupe_keeps_most_complete_record_per_domain():
+    """Best record wins per domain; ties keep the first seen, order follows first sighting."""
+    records = [
+        {"domain": "A.com", "phones": ["+15551234567"]},
+        {"domain": "b.com", "facebook": "facebook.com/b"},
+        {"domain": "a.com ", "phones": ["+15551234567"], "address": "1 Main St"},
+        {"domain": ""},
+        {"domain": "b.com", "twitter": "twitter.com/b"},
+    ]
+
+    winners = dedupe_by_domain(records)
+
+    assert winners == [records[2], records[1]]
+
+
+def test_dedupe_short_circuit_matches_full_scoring():
+    """Skipping hopeless candidates picks the same winners as scoring every record."""
+    rng = random.Random(7)
+    fields = ("address", "facebook", "linkedin", "twitter")
+    records = []
+    for _ in range(500):
+        rec = {"domain": f"d{rng.randrange(20)}.com", "phones": ["1"] * rng.randrange(3)}
+        rec.update({f: "x" for f in fields if rng.random() < 0.5})
+        records.append(rec)
+
+    expected = {}
+    for rec in records:
+        best = expected.get(rec["domain"])
+        if best is None or completeness_score(rec) > completeness_score(best):
+            expected[rec["domain"]] = rec
+
+    assert dedupe_by_domain(records) == list(expected.values())
@@ -0,0 +1,87 @@
+"""Test suite for the Elasticsearch loader."""
+import json
+
+import pytest
+
+from src.etl.load_es import main
+
+elasticsearch = pytest.importorskip("elasticsearch")
+Elasticsearch = elasticsearch.Elasticsearch
+# Namespaced client class behind es.indices (no public import path in 8.x)
+IndicesClient = type(Elasticsearch("http://localhost:9200").indices)
+
+
+class _BulkResponse:
+	def __init__(self, body):
+		self.body = body
+
+
+def _fake_bulk(self, *args, operations=None, **kwargs):
+	"""Accept every document except the one with _id 'bad'."""
+	items = []
+	for header in operations[::2]:
+		action = json.loads(header)["index"]
+		if action["_id"] == "bad":
+			items.append({"index": {"_id": "bad", "status": 400, "error": {"type": "mapper_parsing_exception"}}})
+		else:
+			items.append({"index": {"_id": action["_id"], "status": 201}})
+	return _BulkResponse({"errors": any(i["index"]["status"] >= 300 for i in items), "items": items})
+
+
+def _patch_client(monkeypatch, aliases):
+	monkeypatch.setattr(Elasticsearch, "ping", lambda self, **kw: True)
+	monkeypatch.setattr(Elasticsearch, "bulk", _fake_bulk)
+	monkeypatch.setattr(IndicesClient, "exists", lambda self, **kw: True)
+	monkeypatch.setattr(IndicesClient, "get_settings", lambda self, index, **kw: {index: {"settings": {"index": {}}}})
+	monkeypatch.setattr(IndicesClient, "put_settings", lambda self, **kw: None)
+	monkeypatch.setattr(IndicesClient, "refresh", lambda self, **kw: None)
+	monkeypatch.setattr(IndicesClient, "put_alias", lambda self, **kw: aliases.append(kw))
+
+
+def _write_docs(path, domains):
+	path.write_text("".join(json.dumps({"domain": d}) + "\n" for d in domains), encoding="utf-8")
+
+
+def test_load_reports_rejected_documents_and_skips_alias(tmp_path, monkeypatch, capsys):
+	"""A rejected document is warned about, the load fails and the alias stays put."""
+	inp = tmp_path / "serving.ndjson"
+	_write_docs(inp, ("a.com", "bad", "b.com"))
+	aliases = []
+	_patch_client(monkeypatch, aliases)
+
+	rc = main(["--input", str(inp), "--threads", "1", "--chunk-size", "2", "--no-color"])
+
+	out = capsys.readouterr().out
+	assert rc != 0
+	assert aliases == []
+	assert "failed to index document" in out and "mapper_parsing_exception" in out
+	assert "1 records failed to index (2 loaded)" in out
+
+
+def test_load_caps_per_document_warnings(tmp_path, monkeypatch, capsys):
+	"""Only the first few rejections are printed individually."""
+	inp = tmp_path / "serving.ndjson"
+	_write_docs(inp, ["bad"] * 25)
+	aliases = []
+	_patch_client(monkeypatch, aliases)
+
+	rc = main(["--input", str(inp), "--threads", "1", "--chunk-size", "5", "--no-color"])
+
+	out = capsys.readouterr().out
+	assert rc != 0
+	assert aliases == []
+	assert out.count("failed to index document") == 10
+	assert "25 records failed to index" in out
+
+
+def test_load_swaps_alias_when_every_document_indexes(tmp_path, monkeypatch, capsys):
+	inp = tmp_path / "serving.ndjson"
+	_write_docs(inp, ("a.com", "b.com"))
+	aliases = []
+	_patch_client(monkeypatch, aliases)
+
+	rc = main(["--input", str(inp), "--threads", "1", "--no-color"])
+
+	assert rc == 0
+	assert aliases == [{"index": "companies_v1", "name": "companies"}]
+	assert "Loaded 2 records" in capsys.readouterr().out
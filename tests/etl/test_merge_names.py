@@ -0,0 +1,31 @@
+"""Test suite for company-name merging."""
+import csv
+
+from src.etl.merge_names import read_names_csv
+
+
+def _dict_reader_mapping(path):
+    """Reference: the csv.DictReader semantics read_names_csv must keep."""
+    mapping = {}
+    with path.open("r", encoding="utf-8-sig", newline="") as f:
+        for row in csv.DictReader(f):
+            d = (row.get("domain") or "").strip().lower()
+            name = (row.get("company_name") or "").strip()
+            if d and name:
+                mapping[d] = name
+    return mapping
+
+
+def test_read_names_csv_matches_dict_reader(tmp_path):
+    """Duplicate headers resolve to the last column; short and blank rows are skipped."""
+    path = tmp_path / "names.csv"
+    path.write_text(
+        "\ufeffdomain,company_name,domain,company_name\n"
+        "old.com,Old Name,Acme.com ,Acme Inc\n"
+        "beta.io,Beta\n"
+        "x.com,X,,\n"
+        "gamma.org,G,gamma.org,  Gamma LLC \n",
+        encoding="utf-8",
+    )
+
+    assert read_names_csv(path) == _dict_reader_mapping(path) == {"acme.com": "Acme Inc", "gamma.org": "Gamma LLC"}
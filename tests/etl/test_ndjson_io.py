@@ -0,0 +1,43 @@
+"""Test suite for the shared ETL NDJSON reader and writer."""
+import pytest
+
+from src.etl import ndjson_io
+from src.etl.ndjson_io import read_ndjson, write_ndjson
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_ndjson_round_trip(tmp_path, monkeypatch, use_orjson):
+    """NDJSON helpers round-trip UTF-8 and skip blank or malformed lines."""
+    if not use_orjson:
+        monkeypatch.setattr(ndjson_io, "orjson", None)
+    path = tmp_path / "records.ndjson"
+    records = [{"domain": "café.fr", "phones": ["+33123456789"]}, {"domain": "b.com", "phones": []}]
+
+    write_ndjson(path, records)
+    with path.open("ab") as f:
+        f.write(b"\n{not json}\n")
+
+    assert list(read_ndjson(path)) == records
+
+
+def test_read_ndjson_skips_blank_and_bad_lines(tmp_path):
+    """Mapped reads tolerate CRLF, blank/invalid lines, a missing final newline and empty files."""
+    path = tmp_path / "in.ndjson"
+    path.write_bytes(b'{"a": 1}\r\n\n   \n{"b": 2}\nnot json\n{"c": 3}')
+    empty = tmp_path / "empty.ndjson"
+    empty.write_bytes(b"")
+
+    assert list(read_ndjson(path)) == [{"a": 1}, {"b": 2}, {"c": 3}]
+    assert list(read_ndjson(empty)) == []
+
+
+def test_write_ndjson_writer_thread_matches_inline(tmp_path, monkeypatch):
+    """Background writer produces byte-identical output across batch boundaries."""
+    monkeypatch.setattr(ndjson_io, "_WRITE_BATCH", 3)
+    records = [{"domain": f"site{i}.com", "phones": []} for i in range(10)]
+
+    write_ndjson(tmp_path / "inline.ndjson", records)
+    monkeypatch.setenv("PHIDI_WRITER_THREAD", "1")
+    write_ndjson(tmp_path / "threaded.ndjson", records)
+
+    assert (tmp_path / "threaded.ndjson").read_bytes() == (tmp_path / "inline.ndjson").read_bytes()
@@ -1,5 +1,8 @@
 """Test suite for data normalization logic."""
-from src.etl.normalize import normalize_record
+import pytest
+
+from src.etl import normalize
+from src.etl.normalize import normalize_record, normalize_records
 
 
 def test_normalize_record_with_instagram():
@@ -75,3 +78,36 @@ def test_normalize_record_all_fields():
     assert result["company_name"] == "Example"  # Derived from domain
     assert len(result["phones"]) >= 1
     assert result["address"] is not None
+
+
+def test_normalize_records_parallel_matches_serial(monkeypatch):
+    """Worker-pool normalization keeps input order and matches in-process results."""
+    monkeypatch.setattr(normalize, "_NORMALIZE_CHUNK", 2)
+    raw = [
+        {"domain": f"site{i}.com", "phones": ["(555) 987-6543"], "facebook_url": f"https://facebook.com/site{i}"}
+        for i in range(7)
+    ]
+
+    assert list(normalize_records(raw, workers=2)) == [normalize_record(r) for r in raw]
+
+
+def test_normalize_records_defaults_to_in_process(monkeypatch):
+    """No worker pool is started unless workers are requested."""
+    def _no_pool(*args, **kwargs):
+        raise AssertionError("process pool started by default")
+
+    monkeypatch.setattr(normalize, "ProcessPoolExecutor", _no_pool)
+    raw = [{"domain": "example.com", "phones": []}]
+
+    assert list(normalize_records(raw)) == [normalize_record(raw[0])]
+
+
+@pytest.mark.parametrize("domain,expected", [
+    ("acme-widgets.com", "Acme Widgets"),
+    ("my_site.co.uk", "My Site"),
+    ("---.com", None),
+    ("münchen-bau.de", "München Bau"),
+])
+def test_derive_company_name_from_domain(domain, expected):
+    """Company name falls back to the title-cased first domain label."""
+    assert normalize._derive_company_name(domain) == expected
@@ -0,0 +1,84 @@
+"""Test metric aggregation over hand-built crawl records."""
+
+from __future__ import annotations
+
+import math
+
+from src.eval.compute_metrics import CrawlRecord, compute_metrics_for_dataset, group_best_record_by_domain
+from src.eval.evaluate import compute_eval_for_dataset
+
+
+def _rec(domain, status, latency=None, phones=(), address=None, error=None, **social):
+    return CrawlRecord(
+        domain=domain,
+        http_status=status,
+        response_time_ms=latency,
+        phones=list(phones),
+        facebook_url=social.get("facebook_url"),
+        linkedin_url=social.get("linkedin_url"),
+        twitter_url=social.get("twitter_url"),
+        instagram_url=social.get("instagram_url"),
+        address=address,
+        error=error,
+    )
+
+
+RECORDS = [
+    _rec("a.com", 200, 100.0, phones=["+15551234567", "+15559876543"], address="1 Main St",
+         facebook_url="facebook.com/a", twitter_url="twitter.com/a"),
+    _rec("b.com", None, error="SSL handshake failed"),
+    _rec("b.com", 301, 300.0, address="   ", instagram_url="instagram.com/b"),
+    _rec("c.com", 404, 50.0),
+    _rec("d.com", 503),
+    _rec("e.com", None, error="Connection timeout"),
+    _rec("f.com", 200, phones=["+15550000000"], linkedin_url="linkedin.com/company/f"),
+]
+INPUT_DOMAINS = ["a.com", "b.com", "c.com", "d.com", "e.com", "f.com", "g.com"]
+
+
+def test_compute_metrics_for_dataset_counts():
+    row = compute_metrics_for_dataset("python", INPUT_DOMAINS, RECORDS)
+
+    assert row["total_sites"] == 7
+    assert row["successes"] == 3
+    assert row["coverage_pct"] == 42.9
+    assert row["phone_fill_pct"] == 66.7
+    assert row["social_fill_pct"] == 100.0
+    assert row["address_fill_pct"] == 33.3
+    assert row["facebook_fill_pct"] == 33.3
+    assert row["linkedin_fill_pct"] == 33.3
+    assert row["twitter_fill_pct"] == 33.3
+    assert row["instagram_fill_pct"] == 33.3
+    assert row["avg_latency_ms"] == 200.0
+    assert row["p50_latency_ms"] == 200.0
+    assert row["p95_latency_ms"] == 300.0
+    assert (row["fail_timeout"], row["fail_404"], row["fail_5xx"], row["fail_ssl"], row["fail_other"]) == (1, 1, 1, 0, 1)
+
+
+def test_compute_metrics_for_dataset_without_successes():
+    row = compute_metrics_for_dataset("python", ["x.com"], [])
+
+    assert row["successes"] == 0
+    assert row["phone_fill_pct"] == 0.0
+    assert math.isnan(row["p95_latency_ms"])
+    assert row["fail_other"] == 1
+
+
+def test_compute_eval_for_dataset_datapoints():
+    row = compute_eval_for_dataset("python", INPUT_DOMAINS, RECORDS)
+
+    assert row.successes == 3
+    assert row.phone_fill_rate == 2 / 3
+    assert row.address_fill_rate == 1 / 3
+    # a.com: 2 phones + 2 socials + address; b.com: 1 social; f.com: 1 phone + 1 social
+    assert row.total_datapoints == 8
+    assert row.avg_response_time_ms == 200.0
+
+
+def test_group_best_record_by_domain_filters_to_input_domains():
+    extra = _rec("not-in-input.com", 200)
+    by_domain = group_best_record_by_domain(RECORDS + [extra], set(INPUT_DOMAINS))
+
+    assert "not-in-input.com" not in by_domain
+    assert by_domain["b.com"] is RECORDS[2]
+    assert group_best_record_by_domain([extra])["not-in-input.com"] is extra
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import pytest
+
 from src.eval.format_adapters import (
+    FORMAT_ADAPTERS,
+    SOCIAL_FIELDS,
     AutoDetectAdapter,
     PythonNodeFormatAdapter,
     ScrapyFormatAdapter,
+    compile_spec,
+    extract_record,
     get_adapter_for_crawler,
     get_default_adapter,
 )
@@ -202,3 +208,62 @@ def test_adapter_missing_domain():
     adapter = PythonNodeFormatAdapter()
     obj = {}
     assert adapter.get_domain(obj) == ""
+
+
+def test_extract_record_matches_getters():
+    """Test extract_record agrees with the per-field getters."""
+    obj = {
+        "domain": "example.com",
+        "http_status": 200,
+        "response_time_ms": 12.5,
+        "phones": None,
+        "facebook": "https://facebook.com/example",
+        "linkedin_url": "https://linkedin.com/company/example",
+        "address": "1 Main St",
+        "error_message": "TimeoutError",
+    }
+    for adapter in (PythonNodeFormatAdapter(), ScrapyFormatAdapter(), AutoDetectAdapter()):
+        record = adapter.extract_record(obj)
+        assert record["http_status"] == adapter.get_http_status(obj)
+        assert record["response_time_ms"] == adapter.get_response_time_ms(obj)
+        assert record["phones"] == adapter.get_phones(obj) == []
+        assert record["address"] == adapter.get_address(obj)
+        assert record["error"] == adapter.get_error(obj)
+        for key, value in adapter.get_social_urls(obj).items():
+            assert record[key] == value
+
+
+def test_compile_spec_matches_extract_record():
+    """Test compiled specs follow the generic first-truthy rule."""
+    spec = {
+        "http_status": ("http_status", "status_code"),
+        "response_time_ms": ("response_time_ms",),
+        "phones": ("phones",),
+        "address": ("address", "street", "location"),
+        "error": ("error", "error_message"),
+    }
+    extract = compile_spec(spec)
+    for obj in (
+        {"status_code": 200, "street": "", "location": "1 Main St", "error": ""},
+        {"http_status": 0, "phones": ["+15551234567"], "address": "2 Main St"},
+        {},
+    ):
+        assert extract(obj) == extract_record(obj, spec)
+
+
+def test_adapter_registry_is_cached_and_read_only():
+    """Test adapter lookups return shared instances from a read-only registry."""
+    assert get_adapter_for_crawler("Scrapy") is get_adapter_for_crawler("scrapy")
+    assert get_adapter_for_crawler("unknown") is get_default_adapter()
+    assert get_adapter_for_crawler("python") is get_adapter_for_crawler("node")
+    assert get_default_adapter().adapters == [FORMAT_ADAPTERS["python"], FORMAT_ADAPTERS["scrapy"]]
+    with pytest.raises(TypeError):
+        FORMAT_ADAPTERS["custom"] = PythonNodeFormatAdapter()  # type: ignore[index]
+
+
+def test_get_social_tuple_matches_social_urls():
+    """Test get_social_tuple lists the same URLs in SOCIAL_FIELDS order."""
+    obj = {"facebook": "https://facebook.com/a", "twitter_url": "https://twitter.com/a"}
+    for adapter in (PythonNodeFormatAdapter(), ScrapyFormatAdapter(), AutoDetectAdapter()):
+        social = adapter.get_social_urls(obj)
+        assert adapter.get_social_tuple(obj) == tuple(social[name] for name in SOCIAL_FIELDS)
@@ -161,3 +161,56 @@ def test_parse_mixed_formats():
         assert scrapy_rec.social["facebook_url"] == "https://facebook.com/scrapy"
     finally:
         temp_path.unlink()
+
+
+def test_parse_ndjson_skips_blank_and_invalid_lines(tmp_path):
+    """Test that blank, whitespace-only and malformed lines are skipped."""
+    path = tmp_path / "results.ndjson"
+    path.write_bytes(
+        b'{"domain": "a.com", "http_status": 200}\r\n'
+        b"\n"
+        b"   \n"
+        b"{not json\n"
+        b'  {"domain": "b.com", "http_status": 404}'
+    )
+    
+    records = parse_ndjson(path, PythonNodeFormatAdapter())
+    
+    assert [(r.domain, r.http_status) for r in records] == [("a.com", 200), ("b.com", 404)]
+
+
+def test_parse_ndjson_parallel_matches_serial(tmp_path, monkeypatch):
+    """Test that worker-parsed byte ranges give the same records in file order."""
+    from src.eval import compute_metrics
+    
+    monkeypatch.setattr(compute_metrics, "_PARALLEL_MIN_BYTES", 1)
+    path = tmp_path / "results.ndjson"
+    lines = [json.dumps({"domain": f"site{i}.com", "http_status": 200, "phones": ["+1555"] * (i % 3)}) for i in range(50)]
+    lines.insert(10, "")
+    lines.insert(20, "{broken")
+    path.write_text("\n".join(lines), encoding="utf-8")
+    
+    serial = parse_ndjson(path, PythonNodeFormatAdapter())
+    parallel = parse_ndjson(path, PythonNodeFormatAdapter(), workers=3)
+    
+    assert len(serial) == 50
+    assert parallel == serial
+
+
+def test_iter_ndjson_streams_records(tmp_path):
+    """Test that iter_ndjson yields the same records lazily and tolerates missing files."""
+    from src.eval.compute_metrics import iter_ndjson
+    
+    path = tmp_path / "results.ndjson"
+    path.write_text(
+        json.dumps({"domain": "a.com", "http_status": 200}) + "\n"
+        + json.dumps({"domain": "b.com", "status_code": 500}) + "\n",
+        encoding="utf-8",
+    )
+    
+    stream = iter_ndjson(path)
+    
+    assert next(stream).domain == "a.com"
+    assert [r.domain for r in stream] == ["b.com"]
+    assert list(iter_ndjson(path)) == parse_ndjson(path)
+    assert list(iter_ndjson(tmp_path / "missing.ndjson")) == []
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from src.selector.choose_dataset import MetricsRow
+import hashlib
+
+from src.selector.choose_dataset import MetricsRow, copy_dataset, count_lines, hash_and_count, read_metrics, sha256_file
 
 
 def test_weighted_scoring_ranks_python_over_node():
@@ -31,3 +33,71 @@ def test_weighted_scoring_ranks_python_over_node():
     assert py.quality == (0.78 + 0.65 + 0.42) / 3
     assert node.quality == (0.75 + 0.68 + 0.38) / 3
     assert py_score > node_score, f"expected python to win; {py_score=}, {node_score=}"
+
+
+def test_sha256_file_with_and_without_file_digest(tmp_path, monkeypatch):
+    path = tmp_path / "data.ndjson"
+    data = b'{"domain": "example.com"}\n' * 50000  # Spans more than one 1 MiB buffer
+    path.write_bytes(data)
+    expected = "sha256:" + hashlib.sha256(data).hexdigest()
+
+    assert sha256_file(path) == expected
+    monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    assert sha256_file(path) == expected
+
+
+def test_count_lines(tmp_path):
+    path = tmp_path / "data.ndjson"
+    path.write_bytes(b"")
+    assert count_lines(path) == 0
+    path.write_bytes(b'{"a": 1}\n{"a": 2}\n')
+    assert count_lines(path) == 2
+    path.write_bytes(b'{"a": 1}\n{"a": 2}')
+    assert count_lines(path) == 2
+
+
+def test_hash_and_count_matches_separate_passes(tmp_path):
+    path = tmp_path / "data.ndjson"
+    for data in (b"", b'{"a": 1}\n' * 200000, b'{"a": 1}\n{"a": 2}'):
+        path.write_bytes(data)
+        assert hash_and_count(path) == (sha256_file(path), count_lines(path))
+
+
+def test_read_metrics_ratio_and_pct_columns(tmp_path):
+    path = tmp_path / "metrics.csv"
+    path.write_text(
+        "crawler,name,coverage,coverage_pct,phone_fill_pct\n"
+        "python,,78,,50\n"
+        ",node,,93.8,\n"
+        ",,0.5,,\n",
+        encoding="utf-8",
+    )
+    rows = read_metrics(path)
+
+    assert [r.crawler for r in rows] == ["python", "node"]
+    assert rows[0].coverage == 0.78  # 78 in a ratio column is read as a percentage
+    assert rows[0].phone_fill == 0.5
+    assert rows[1].coverage == 0.938
+    assert rows[1].phone_fill == 0.0
+
+
+def test_copy_dataset_with_and_without_copy_file_range(tmp_path, monkeypatch):
+    source = tmp_path / "source.ndjson"
+    data = b'{"domain": "example.com"}\n' * 50000
+    source.write_bytes(data)
+
+    copy_dataset(source, tmp_path / "a.ndjson")
+    assert (tmp_path / "a.ndjson").read_bytes() == data
+    monkeypatch.delattr("os.copy_file_range", raising=False)
+    copy_dataset(source, tmp_path / "b.ndjson")
+    assert (tmp_path / "b.ndjson").read_bytes() == data
+
+
+def test_copy_dataset_onto_itself_keeps_data(tmp_path):
+    path = tmp_path / "crawl_results.ndjson"
+    data = b'{"domain": "example.com"}\n'
+    path.write_bytes(data)
+
+    copy_dataset(path, path)
+    copy_dataset(path, tmp_path / "." / "crawl_results.ndjson")
+    assert path.read_bytes() == data